@@ -0,0 +1,3646 @@
+"""
+Jere Liimatainen
+3D_object_visualizer / 3-uloitteisten kappaleiden havainnollistaja
+
+The objects, their projection and drawing, mesh files and the headless frame
+buffer of the 3D object visualizer. The module doesn't import tkinter, so it
+can be imported into tools and tests without a display. Objects are drawn on
+anything that has the methods of a Tk canvas they use, or on a FrameBuffer.
+
+The graphical interface is in object_visualizer_gui.py and the command line
+entry point in 3d_object_visualizer.py.
+"""
+
+import time
+from math import *
+import random
+import itertools
+import collections
+import contextlib
+import csv
+import os
+import re
+import struct
+import zlib
+import weakref
+import numpy as np
+
+def line_length(p1, p2):
+    """
+    Calculates the length of a line drawn between two points. (Same as the
+    distance between two points.)
+
+    :param tuple p1: First point. Coordinates are (x, y, z)
+    :param tuple p2: Second point. Coordinates are (x, y, z)
+    :return: The distance between p1 and p2.
+    """
+
+    x1 = p1[0]
+    y1 = p1[1]
+    z1 = p1[2]
+
+    x2 = p2[0]
+    y2 = p2[1]
+    z2 = p2[2]
+
+    length = sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
+
+    return length
+
+
+def point_connector(points):
+    """
+    Calculates all possible connections between given points.
+    :param list points: Points are given in a list containing points as tuples.
+    :return: All possible connections between given points as an int32 numpy
+             array of shape (n * (n - 1) / 2, 2). A connection has the index
+             of points to be connected, for example connection (0, 1) would
+             mean connection from 1st point to 2nd point.
+    """
+
+    # The index pairs above the diagonal of an n x n matrix are exactly the
+    # pairs itertools.combinations would give, in the same order.
+    first, second = np.triu_indices(len(points), 1)
+
+    connections = np.empty((len(first), 2), dtype=np.int32)
+    connections[:, 0] = first
+    connections[:, 1] = second
+
+    return connections
+
+
+def grid_neighbor_pairs(vertexes, radius):
+    """
+    Finds all pairs of points that are at most given distance apart. The
+    points are sorted into a grid of cells of that size, so each point only
+    needs to be compared to the points in its own and neighboring cells
+    instead of all other points.
+    :param numpy array vertexes: The points, shape (n, 3).
+    :param float radius: The largest distance between paired points.
+    :return: Index pairs (i, j), where i < j, as an int64 numpy array of shape
+             (m, 2) and the distances between the paired points.
+    """
+
+    cells = np.floor((vertexes - vertexes.min(axis=0)) / radius)
+    cells = cells.astype(np.int64) + 1
+
+    # One empty cell is left on every side, so the neighbors of a cell can be
+    # found by adding a constant to the cell's key.
+    size = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * size[1] + cells[:, 1]) * size[2] + cells[:, 2]
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pair_chunks = []
+    for dx, dy, dz in itertools.product((-1, 0, 1), repeat=3):
+        neighbor_keys = keys + (dx * size[1] + dy) * size[2] + dz
+
+        # Points of the neighboring cell are next to each other in order.
+        first = np.searchsorted(sorted_keys, neighbor_keys, "left")
+        counts = np.searchsorted(sorted_keys, neighbor_keys, "right") - first
+
+        points = np.repeat(np.arange(len(vertexes)), counts)
+        positions = np.arange(counts.sum()) \
+            - np.repeat(np.cumsum(counts) - counts - first, counts)
+        neighbors = order[positions]
+
+        # Every pair is found from both of its points, only one is kept.
+        keep = points < neighbors
+        pair_chunks.append(np.stack([points[keep], neighbors[keep]], axis=1))
+
+    pairs = np.concatenate(pair_chunks)
+    distances = np.sqrt(((vertexes[pairs[:, 0]]
+                          - vertexes[pairs[:, 1]]) ** 2).sum(axis=1))
+    close = distances <= radius
+
+    return pairs[close], distances[close]
+
+
+def shortest_distance(vertexes):
+    """
+    Finds the shortest distance between two points at different positions.
+    :param numpy array vertexes: The points, shape (n, 3).
+    :return: The shortest distance as a float.
+    """
+
+    extent = (vertexes.max(axis=0) - vertexes.min(axis=0)).max()
+    if extent == 0:
+        raise ValueError("all points are at the same position")
+
+    # Starts from the average spacing of the points and grows the search
+    # radius until some pair is found. All pairs closer than the radius are
+    # found, so the closest one found is the closest of all.
+    radius = extent / len(vertexes) ** (1 / 3)
+
+    while True:
+        pairs, distances = grid_neighbor_pairs(vertexes, radius)
+        distances = distances[distances > 0]
+
+        if len(distances):
+            return distances.min()
+
+        radius *= 2
+
+
+def nearest_neighbor_edges(vertexes, edge_length=None, tolerance=1e-6):
+    """
+    Connects all points that are at given distance from each other. This is
+    used to find the edges of regular polyhedra, where all edges have the
+    same length.
+    :param list vertexes: The points as (x, y, z) tuples or a numpy array.
+    :param float edge_length: The length of the edges. If not given, the
+           shortest distance between the points is used.
+    :param float tolerance: The largest allowed relative difference between
+           an edge's length and edge_length.
+    :return: The edges as an int32 numpy array of shape (m, 2), sorted in the
+             same order as point_connector.
+    """
+
+    vertexes = np.asarray(vertexes, dtype=float)
+
+    if edge_length is None:
+        edge_length = shortest_distance(vertexes)
+
+    pairs, distances = grid_neighbor_pairs(vertexes,
+                                           edge_length * (1 + tolerance))
+    pairs = pairs[np.abs(distances - edge_length) <= edge_length * tolerance]
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    return pairs.astype(np.int32)
+
+
+def matrix_multiplication(matrix, vector):
+    """
+    This function is used to multiply given vector with given matrix.
+    :param list matrix: A 3x3 matrix that is a list containing all rows as
+           lists.
+    :param list vector: A 1x3 vector.
+    :return: Resulting 1x3 vector as a list.
+    """
+
+    output_matrix = [0, 0, 0]
+
+    for i in range(3):
+        for n in range(len(matrix[i])):
+            output_matrix[i] += matrix[i][n] * vector[n]
+
+    return output_matrix
+
+
+def rotation_matrix_x(degree):
+    """
+    This function returns a rotation matrix that will be used to rotate
+    a vector around x-axis for given degree.
+    :param float degree: Used to determinate how much rotation there will be.
+    :return: The 3x3 rotation matrix for given degree as a list.
+    """
+
+    return [[cos(degree), 0, sin(degree)], [0, 1, 0],
+            [-sin(degree), 0, cos(degree)]]
+
+
+def rotation_matrix_y(degree):
+    """
+    This function returns a rotation matrix that will be used to rotate
+    a vector around y-axis for given degree.
+    :param float degree: Used to determinate how much rotation there will be.
+    :return: The 3x3 rotation matrix for given degree as a list.
+    """
+
+    return [[1, 0, 0], [0, cos(degree), -sin(degree)],
+            [0, sin(degree), cos(degree)]]
+
+
+def rotation_matrix_z(degree):
+    """
+    This function returns a rotation matrix that will be used to rotate
+    a vector around z-axis for given degree.
+    :param float degree: Used to determinate how much rotation there will be.
+    :return: The 3x3 rotation matrix for given degree as a list.
+    """
+
+    return [[cos(degree), -sin(degree), 0], [sin(degree), cos(degree), 0],
+            [0, 0, 1]]
+
+
+def combined_rotation_matrix(x_degree, y_degree, z_degree):
+    """
+    This function composes the x-, y- and z-rotation matrices into one matrix,
+    so that a whole array of vectors can be rotated with a single
+    multiplication. The rotations are applied in the same order as in
+    Object.proj: first x, then y and finally z.
+    :param float x_degree: The degree of rotation used in rotation_matrix_x.
+    :param float y_degree: The degree of rotation used in rotation_matrix_y.
+    :param float z_degree: The degree of rotation used in rotation_matrix_z.
+    :return: The combined 3x3 rotation matrix as a numpy array.
+    """
+
+    return np.array(rotation_matrix_z(z_degree)) \
+        @ np.array(rotation_matrix_y(y_degree)) \
+        @ np.array(rotation_matrix_x(x_degree))
+
+
+class TransformCache:
+    # This class keeps the combined rotation matrices of the latest rotation
+    # states, so that states that come back, like when the objects of a scene
+    # rotate alike or a rotation cycles back to where it started, don't need
+    # any trigonometry. The rotation degrees are quantized to
+    # ROTATION_CACHE_STEPS steps per full turn to find the repeating states.
+
+    def __init__(self, capacity):
+        """
+        :param int capacity: The number of rotation states kept in the cache.
+               The state that has been used longest ago is dropped first.
+        """
+
+        self.__capacity = capacity
+        self.__matrices = collections.OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def rotation(self, x_degree, y_degree, z_degree):
+        """
+        Returns the combined rotation matrix of given rotation degrees.
+        :param float x_degree: The degree of rotation around x-axis.
+        :param float y_degree: The degree of rotation around y-axis.
+        :param float z_degree: The degree of rotation around z-axis.
+        :return: The matrix as a tuple (matrix, rows), where matrix is a read
+                 only 3x3 numpy array and rows contains the same matrix as
+                 lists for matrix_multiplication.
+        """
+
+        steps = ROTATION_CACHE_STEPS
+        key = tuple(round(degree / (2 * pi) * steps) % steps
+                    for degree in (x_degree, y_degree, z_degree))
+
+        rotation = self.__matrices.get(key)
+        if rotation is not None:
+            self.__hits += 1
+            self.__matrices.move_to_end(key)
+            return rotation
+
+        self.__misses += 1
+
+        matrix = combined_rotation_matrix(*(step * 2 * pi / steps
+                                            for step in key))
+        matrix.setflags(write=False)
+        rotation = matrix, matrix.tolist()
+
+        self.__matrices[key] = rotation
+        if len(self.__matrices) > self.__capacity:
+            self.__matrices.popitem(last=False)
+
+        return rotation
+
+    def statistics(self):
+        # Returns the number of cache hits, misses and stored matrices.
+        return {"hits": self.__hits, "misses": self.__misses,
+                "size": len(self.__matrices)}
+
+    def clear(self):
+        self.__matrices.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+def perspective_project(points, distance, focal_length, near, far):
+    """
+    Projects points with a perspective camera, that is on the positive z-axis
+    at given distance from the origin and looks towards the origin. The
+    parameters of the camera can also be arrays with a value for every point.
+    :param numpy array points: The points relative to the point the camera
+           looks at, shape (n, 3).
+    :param float distance: The distance of the camera from the origin.
+    :param float focal_length: The distance of the image plane from the
+           camera in pixels. Points at the origin's depth keep their size if
+           this is the same as distance.
+    :param float near: The smallest depth that is drawn.
+    :param float far: The largest depth that is drawn.
+    :return: The projected points as a float numpy array of shape (n, 2).
+             Points outside the depth range are NaN.
+    """
+
+    depths = distance - points[:, 2]
+    inside = (depths >= near) & (depths <= far)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(inside, focal_length / depths, np.nan)
+
+    return points[:, :2] * scale[:, np.newaxis]
+
+
+class Camera:
+    # This class defines the perspective camera the objects are looked at
+    # with. The camera is on the positive z-axis and looks at the center of
+    # the object, so the depth of a point is the camera's distance minus the
+    # point's z-coordinate. Only points between the near and far planes are
+    # drawn, edges that cross the planes are clipped.
+
+    def __init__(self, distance=None, focal_length=None, near=None, far=None):
+        """
+        :param float distance: The distance of the camera from the object's
+               center in pixels. Defaults to CAMERA_DISTANCE.
+        :param float focal_length: The distance of the image plane from the
+               camera in pixels. Defaults to distance, so that the points at
+               the center's depth keep their size.
+        :param float near: The depth of the near plane. Defaults to
+               CAMERA_NEAR.
+        :param float far: The depth of the far plane. Defaults to CAMERA_FAR.
+        """
+
+        if distance is None:
+            distance = CAMERA_DISTANCE
+        if focal_length is None:
+            focal_length = distance
+        if near is None:
+            near = CAMERA_NEAR
+        if far is None:
+            far = CAMERA_FAR
+
+        if not 0 < near < far:
+            raise ValueError("the near plane has to be in front of the camera "
+                             "and closer than the far plane")
+
+        self.__distance = distance
+        self.__focal_length = focal_length
+        self.__near = near
+        self.__far = far
+
+    def parameters(self):
+        # Returns the distance, focal length, near and far depth as a tuple in
+        # the order perspective_project takes them.
+        return self.__distance, self.__focal_length, self.__near, self.__far
+
+    def project(self, points):
+        """
+        Projects points relative to the object's center, see
+        perspective_project.
+        :param numpy array points: The points, shape (n, 3).
+        :return: The projected points, shape (n, 2). Points outside the depth
+                 range are NaN.
+        """
+
+        return perspective_project(points, *self.parameters())
+
+    def project_point(self, point):
+        """
+        Projects one point like project.
+        :param list point: The point as (x, y, z).
+        :return: The projected point as a tuple (x, y), or None if the point
+                 is outside the depth range.
+        """
+
+        x, y, z = point
+        depth = self.__distance - z
+
+        if not self.__near <= depth <= self.__far:
+            return None
+
+        return x * self.__focal_length / depth, y * self.__focal_length / depth
+
+    def clip_segments(self, starts, ends):
+        """
+        Clips lines to the part between the near and far planes. All lines
+        are handled at once.
+        :param numpy array starts: The starting points of the lines relative
+               to the object's center, shape (n, 3).
+        :param numpy array ends: The ending points of the lines, shape (n, 3).
+        :return: A tuple (inside, starts, ends), where inside tells which of
+                 the lines are at least partly between the planes and starts
+                 and ends are the projected clipped points of those lines,
+                 shape (k, 2).
+        """
+
+        start_depths = self.__distance - starts[:, 2]
+        end_depths = self.__distance - ends[:, 2]
+        change = end_depths - start_depths
+
+        # The part of each line that is between the planes, as fractions of
+        # the line from its start.
+        t0 = np.zeros(len(starts))
+        t1 = np.ones(len(starts))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for plane, sign in ((self.__near, 1), (self.__far, -1)):
+                # Distance inside the plane at the start and the change of it.
+                p = sign * change
+                q = sign * (start_depths - plane)
+
+                inside = (p != 0) | (q >= 0)
+                r = -q / p
+                t0 = np.where(inside & (p > 0), np.maximum(t0, r), t0)
+                t1 = np.where(inside & (p < 0), np.minimum(t1, r), t1)
+                t1 = np.where(inside, t1, -1)
+
+        inside = t0 <= t1
+        delta = ends[inside] - starts[inside]
+        starts, ends = (starts[inside] + delta * t[inside, np.newaxis]
+                        for t in (t0, t1))
+
+        def project(points):
+            # The clipped points are on the planes, rounding errors mustn't
+            # move them outside.
+            depths = np.clip(self.__distance - points[:, 2], self.__near,
+                             self.__far)
+            return points[:, :2] * (self.__focal_length / depths)[:, np.newaxis]
+
+        return inside, project(starts), project(ends)
+
+    def scale_bound(self, radius):
+        """
+        :param float radius: The distance of the furthest point from the
+               object's center.
+        :return: The most pixels a projected point within given radius moves
+                 when the point moves by one.
+        """
+
+        depth = max(self.__distance - radius, self.__near)
+
+        return self.__focal_length / depth * (1 + radius / depth)
+
+
+# The vertex and output arrays of a projection worker process, set by
+# attach_projection_buffers.
+projection_buffers = None
+
+
+def attach_projection_buffers(vertex_name, output_name, vertex_count):
+    """
+    Initializes a projection worker process. The worker attaches to the
+    shared memory blocks of ParallelProjector once, so that the vertexes
+    don't need to be sent to the worker on every frame.
+    :param str vertex_name: Name of the shared memory block of the vertexes.
+    :param str output_name: Name of the shared memory block the projected
+           points are written into.
+    :param int vertex_count: The number of vertexes.
+    :return: none
+    """
+
+    global projection_buffers
+
+    from multiprocessing import shared_memory
+
+    vertex_memory = shared_memory.SharedMemory(name=vertex_name)
+    output_memory = shared_memory.SharedMemory(name=output_name)
+
+    vertexes = np.ndarray((vertex_count, 3), dtype=np.float64,
+                          buffer=vertex_memory.buf)
+    output = np.ndarray((vertex_count, 2), dtype=np.float64,
+                        buffer=output_memory.buf)
+
+    # The memory blocks are kept with the arrays, so that they aren't closed
+    # while the worker is running.
+    projection_buffers = vertexes, output, vertex_memory, output_memory
+
+
+def project_chunk(start, end, matrix, size, camera_parameters):
+    """
+    Projects the vertexes start...end-1 in a worker process the same way as
+    Object.project_vertexes and writes them into the shared output array.
+    :param int start: Index of the first vertex.
+    :param int end: Index after the last vertex.
+    :param list matrix: The combined rotation matrix as lists.
+    :param float size: The size of the object.
+    :param tuple camera_parameters: The parameters of the camera as returned
+           by Camera.parameters.
+    :return: none
+    """
+
+    vertexes, output = projection_buffers[:2]
+
+    rotated = vertexes[start:end] @ (np.array(matrix).T * size)
+    output[start:end] = perspective_project(rotated, *camera_parameters)
+
+
+def close_parallel_projector(executor, memories):
+    # Stops the worker processes and frees the shared memory of a
+    # ParallelProjector.
+    executor.shutdown(wait=True, cancel_futures=True)
+
+    for memory in memories:
+        memory.close()
+        memory.unlink()
+
+
+class ParallelProjector:
+    # This class projects the vertexes of a very large object with a pool of
+    # worker processes. The vertexes are copied into shared memory once and
+    # every worker writes its part of the projected points into a shared
+    # output array, so only the rotation matrix and the chunk limits are
+    # sent to the workers on every frame.
+
+    def __init__(self, vertexes, workers=None):
+        """
+        :param numpy array vertexes: The vertexes of the object, shape (n, 3).
+        :param int workers: The number of worker processes. Defaults to
+               PROJECTION_WORKERS or the number of CPUs.
+        """
+
+        # The multiprocessing modules are imported only when they are needed,
+        # because importing them takes a noticeable part of the startup time.
+        import concurrent.futures
+        from multiprocessing import shared_memory
+
+        vertexes = np.asarray(vertexes, dtype=np.float64).reshape(-1, 3)
+
+        if workers is None:
+            workers = PROJECTION_WORKERS or os.cpu_count() or 1
+
+        self.__vertex_count = len(vertexes)
+
+        # Shared memory blocks can't be empty.
+        self.__vertex_memory = shared_memory.SharedMemory(
+            create=True, size=max(vertexes.nbytes, 1))
+        self.__output_memory = shared_memory.SharedMemory(
+            create=True, size=max(self.__vertex_count * 16, 1))
+
+        np.ndarray(vertexes.shape, dtype=np.float64,
+                   buffer=self.__vertex_memory.buf)[:] = vertexes
+        self.__output = np.ndarray((self.__vertex_count, 2), dtype=np.float64,
+                                   buffer=self.__output_memory.buf)
+
+        self.__executor = concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=attach_projection_buffers,
+            initargs=(self.__vertex_memory.name, self.__output_memory.name,
+                      self.__vertex_count))
+
+        # Every worker gets a few chunks, so that a slow worker doesn't keep
+        # the others waiting.
+        bounds = np.linspace(0, self.__vertex_count,
+                             min(workers * 4, self.__vertex_count) + 1)
+        bounds = bounds.astype(int).tolist()
+        self.__chunks = list(zip(bounds, bounds[1:]))
+
+        self.__finalizer = weakref.finalize(
+            self, close_parallel_projector, self.__executor,
+            (self.__vertex_memory, self.__output_memory))
+
+    def project(self, matrix, size, camera):
+        """
+        Projects all vertexes like Object.project_vertexes.
+        :param numpy array matrix: The combined rotation matrix.
+        :param float size: The size of the object.
+        :param Camera camera: The camera the object is looked at with.
+        :return: The projected points relative to the object's center as a
+                 float numpy array of shape (n, 2). The array is shared with
+                 the workers and overwritten by the next projection.
+        """
+
+        matrix = np.asarray(matrix).tolist()
+        parameters = camera.parameters()
+        futures = [self.__executor.submit(project_chunk, start, end, matrix,
+                                          size, parameters)
+                   for start, end in self.__chunks]
+
+        for future in futures:
+            future.result()
+
+        return self.__output
+
+    def close(self):
+        # Stops the worker processes and frees the shared memory.
+        self.__finalizer()
+
+
+class ParseError(ValueError):
+    # Raised when a list of points, edges or faces given as text can't be
+    # parsed. The position of the error in the text is kept, so that it can
+    # be shown to the user.
+
+    def __init__(self, message, position):
+        """
+        :param str message: What is wrong.
+        :param int position: The index of the character in the text where
+               the error is.
+        """
+
+        ValueError.__init__(self, "%s at character %d" % (message,
+                                                          position + 1))
+        self.message = message
+        self.position = position
+
+
+def tuple_list_error(text, start, length, integers):
+    """
+    Finds the exact position and reason of an error in a list of tuples, by
+    reading the tuple that couldn't be parsed one token at a time.
+    :param str text: The text being parsed.
+    :param int start: The index where the first tuple that couldn't be
+           parsed starts.
+    :param int length: The number of values in a tuple, or None if the
+           tuples can have any number of values.
+    :param boolean integers: True if the values have to be integers.
+    :return: A ParseError.
+    """
+
+    number = re.compile(NUMBER_PATTERN)
+    integer = re.compile(INTEGER_PATTERN + r"(?![.\deE])")
+    space = re.compile(r"\s*")
+
+    def value_error(position):
+        # Tells what is wrong with the text at position, where a value
+        # should be.
+        if position == len(text):
+            return ParseError("the text ends in the middle of a tuple",
+                              position)
+        if integers and number.match(text, position):
+            return ParseError("expected an integer", position)
+        return ParseError("expected a number", position)
+
+    position = space.match(text, start).end()
+
+    if "(" not in text and length is not None:
+        # Without parentheses the values are read length at a time, so the
+        # error is either an invalid value or an incomplete last tuple.
+        values = (integer if integers else number).match(text, position)
+        if values is None:
+            return value_error(position)
+
+        return ParseError("the last tuple has less than %d values" % length,
+                          position)
+
+    if text[position] != "(":
+        return ParseError("expected '('", position)
+
+    tuple_start = position
+    count = 0
+    position += 1
+
+    while True:
+        position = space.match(text, position).end()
+        value = (integer if integers else number).match(text, position)
+
+        if value is None:
+            if count == 0 and text.startswith(")", position):
+                return ParseError("empty tuple", tuple_start)
+            return value_error(position)
+
+        count += 1
+        position = space.match(text, value.end()).end()
+
+        if text.startswith(",", position):
+            position += 1
+        elif text.startswith(")", position):
+            break
+        elif position == len(text):
+            return ParseError("missing ')'", position)
+        elif position == value.end():
+            return ParseError("expected ',' or ')'", position)
+
+    if length is not None and count != length:
+        return ParseError("a tuple has to have %d values, not %d"
+                          % (length, count), tuple_start)
+
+    return ParseError("expected ',' between tuples", position + 1)
+
+
+def invalid_value_error(text, integers):
+    """
+    Finds the first value of a list of tuples that isn't a valid number, or
+    that is too large to be used.
+    :param str text: The text being parsed.
+    :param boolean integers: True if the values have to be integers.
+    :return: A ParseError.
+    """
+
+    value = re.compile((INTEGER_PATTERN if integers else NUMBER_PATTERN)
+                       + "$")
+    largest = np.iinfo(np.int64).max
+
+    for token in re.finditer(r"[^\s,()]+", text):
+        if not value.match(token.group()):
+            return ParseError("expected an integer" if integers
+                              else "expected a number", token.start())
+
+        if integers and abs(int(token.group())) > largest:
+            return ParseError("the integer is too large", token.start())
+
+        if not integers and not isfinite(float(token.group())):
+            return ParseError("the number is too large", token.start())
+
+    return ParseError("invalid value", 0)
+
+
+def parse_tuples(text, length=None, integers=False):
+    """
+    Parses a list of tuples of numbers, like "(1,2,3), (4.5, 6, -7e2)". The
+    values can be separated with commas, whitespace or both, and so can the
+    tuples. If every tuple has the same number of values, the parentheses
+    can also be left out, in which case the values are read length at a
+    time, like from "1 2 3\n4.5 6 -7e2".
+    The structure of the text is checked with one regular expression and the
+    values are converted with numpy, so long lists are parsed in linear time
+    without a Python loop over the values.
+    :param str text: The text to be parsed.
+    :param int length: The number of values in every tuple, or None if the
+           tuples can have any number of values.
+    :param boolean integers: True if the values have to be integers.
+    :return: If length is given, a numpy array of shape (n, length) that is
+             int64 if integers is True, otherwise float64. If length is None,
+             a list of tuples.
+    :raises ParseError: If the text isn't a list of such tuples.
+    """
+
+    # The values are only roughly matched here, because a simple pattern is
+    # much faster to match. Numpy checks the values when converting them.
+    number = r"[-+\d]+" if integers else r"[-+.\deE]+"
+    separator = VALUE_SEPARATOR_PATTERN
+
+    if length is None:
+        values = r"%s(?:%s%s)*" % (number, separator, number)
+    else:
+        values = number + (separator + number) * (length - 1)
+
+    if "(" in text or length is None:
+        pattern = r"\s*(?:\(\s*%s\s*\)\s*(?:,\s*)?)*" % values
+    else:
+        pattern = r"\s*(?:%s(?:%s|\s*$))*" % (number, separator)
+
+    # The pattern matches as many valid tuples as possible, so the error is
+    # in the tuple after them.
+    end = re.match(pattern, text).end()
+    if end != len(text):
+        raise tuple_list_error(text, end, length, integers)
+
+    dtype = np.int64 if integers else np.float64
+
+    try:
+        if length is None:
+            tuples = [np.array(group.replace(",", " ").split(), dtype=dtype)
+                      for group in re.findall(r"\(([^)]*)\)", text)]
+        else:
+            values = np.array(text.translate(TUPLE_PUNCTUATION).split(),
+                              dtype=dtype)
+
+    # Integers that don't fit into int64 raise OverflowError.
+    except (ValueError, OverflowError):
+        raise invalid_value_error(text, integers) from None
+
+    # Too large numbers are read as infinite, which can't be projected.
+    if not integers and not all(np.isfinite(values).all() for values in
+                                (tuples if length is None else [values])):
+        raise invalid_value_error(text, integers)
+
+    if length is None:
+        return [tuple(values.tolist()) for values in tuples]
+
+    if len(values) % length:
+        raise tuple_list_error(text, tuple_position(text, len(values)
+                                                    // length, length),
+                               length, integers)
+
+    return values.reshape(-1, length)
+
+
+def tuple_position(text, index, length=None):
+    """
+    Finds where a tuple starts in a text parsed by parse_tuples.
+    :param str text: The parsed text.
+    :param int index: The index of the tuple.
+    :param int length: The number of values in a tuple, needed if the text
+           has no parentheses.
+    :return: The index of the tuple's first character in the text.
+    """
+
+    if "(" in text:
+        matches = re.finditer(r"\(", text)
+        index_in_matches = index
+    else:
+        matches = re.finditer(NUMBER_PATTERN, text)
+        index_in_matches = index * length
+
+    return next(itertools.islice(matches, index_in_matches, None)).start()
+
+
+def parse_points(text):
+    """
+    Parses a list of 3D points, like "(1,0,0), (0,1.5,-1)".
+    :param str text: The points as text, see parse_tuples.
+    :return: The points as a float64 numpy array of shape (n, 3).
+    :raises ParseError: If the text isn't a list of points.
+    """
+
+    return parse_tuples(text, 3)
+
+
+def parse_edges(text, vertex_count):
+    """
+    Parses a list of edges, like "(0,1), (1,2)", and checks that every edge
+    connects two different existing vertexes and that no edge is given
+    twice, in either direction.
+    :param str text: The edges as text, see parse_tuples.
+    :param int vertex_count: The number of vertexes the edges connect.
+    :return: The edges as an int32 numpy array of shape (m, 2).
+    :raises ParseError: If the text isn't a list of valid edges.
+    """
+
+    edges = parse_tuples(text, 2, integers=True)
+
+    invalid = np.flatnonzero(((edges < 0) | (edges >= vertex_count)).any(axis=1))
+    if len(invalid):
+        raise ParseError("vertex index out of range",
+                         tuple_position(text, invalid[0], 2))
+
+    loops = np.flatnonzero(edges[:, 0] == edges[:, 1])
+    if len(loops):
+        raise ParseError("an edge has to connect two different vertexes",
+                         tuple_position(text, loops[0], 2))
+
+    # Edges are sorted by their keys, so an edge given twice is next to the
+    # earlier one.
+    keys = edges.min(axis=1) * vertex_count + edges.max(axis=1)
+    order = np.argsort(keys, kind="stable")
+    duplicates = order[1:][keys[order[1:]] == keys[order[:-1]]]
+    if len(duplicates):
+        raise ParseError("duplicate edge",
+                         tuple_position(text, duplicates.min(), 2))
+
+    return edges.astype(np.int32)
+
+
+def parse_faces(text, vertex_count):
+    """
+    Parses a list of faces, like "(0,1,2,3), (4,5,6)". Every face needs at
+    least three different existing vertexes.
+    :param str text: The faces as text, see parse_tuples. The parentheses
+           can't be left out, because the faces can have different numbers
+           of corners.
+    :param int vertex_count: The number of vertexes of the object.
+    :return: The faces as a list of tuples of vertex indexes.
+    :raises ParseError: If the text isn't a list of valid faces.
+    """
+
+    faces = parse_tuples(text, integers=True)
+
+    for index, face in enumerate(faces):
+        if len(face) < 3:
+            message = "a face has to have at least 3 corners"
+        elif len(face) != len(set(face)):
+            message = "a face can't have the same corner twice"
+        elif min(face) < 0 or max(face) >= vertex_count:
+            message = "vertex index out of range"
+        else:
+            continue
+
+        raise ParseError(message, tuple_position(text, index))
+
+    return faces
+
+
+def edge_keys(edges):
+    """
+    Encodes edges into sorted unique integers, so that large edge arrays can
+    be deduplicated with a single sort. Edges (a, b) and (b, a) get the same
+    key and edges that connect a point to itself are removed.
+    :param numpy array edges: Index pairs of connected points, shape (m, 2).
+    :return: The unique keys as a sorted int64 numpy array.
+    """
+
+    edges = np.sort(np.asarray(edges, dtype=np.int64).reshape(-1, 2), axis=1)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+
+    if len(edges) and edges[:, 0].min() < 0:
+        raise ValueError("mesh has an edge to a vertex that doesn't exist")
+
+    return unique_sorted(np.sort((edges[:, 0] << 32) | edges[:, 1]))
+
+
+def unique_sorted(keys):
+    # Removes the duplicates from a sorted numpy array. Sorted keys are unique
+    # if they differ from the previous key.
+    if len(keys) == 0:
+        return keys
+
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+
+
+def polygon_edges(polygons):
+    """
+    Returns the edges of polygons that all have the same number of corners.
+    :param numpy array polygons: Indexes of the polygons' corner points,
+           shape (m, k).
+    :return: The polygons' edges as a numpy array of shape (m * k, 2).
+    """
+
+    return np.stack([polygons, np.roll(polygons, -1, axis=1)],
+                    axis=2).reshape(-1, 2)
+
+
+def parse_obj_polygon(line, vertex_count):
+    # Returns the vertex indexes of an OBJ face- or line-element as 0-based
+    # indexes. Texture and normal references ("1/2/3") are ignored and
+    # negative indexes are relative to the vertexes read so far.
+    indexes = []
+
+    for reference in line.split()[1:]:
+        index = int(reference.split("/", 1)[0])
+        if index < 0:
+            index += vertex_count
+        else:
+            index -= 1
+        indexes.append(index)
+
+    return indexes
+
+
+def load_obj(path):
+    """
+    Reads the vertexes and edges of a Wavefront OBJ-file. The file is read in
+    chunks, so only the resulting arrays need to fit in memory. Edges are
+    taken from faces ("f") and lines ("l").
+    :param str path: Path of the file.
+    :return: The vertexes as a float64 numpy array of shape (n, 3) and the
+             unique edges as an int32 numpy array of shape (m, 2).
+    """
+
+    vertex_chunks = []
+    edge_chunks = []
+    vertex_count = 0
+
+    with open(path) as file:
+        while True:
+            lines = file.readlines(MESH_CHUNK_SIZE)
+            if not lines:
+                break
+
+            vertex_lines = [line[2:] for line in lines if line[:2] == "v "]
+            polygon_lines = [line for line in lines if line[:2] in ("f ", "l ")]
+
+            if vertex_lines:
+                values = np.fromstring("".join(vertex_lines), sep=" ")
+
+                if len(values) != 3 * len(vertex_lines):
+                    # Some vertexes have extra values (w or color), only the
+                    # first three are used.
+                    values = np.array([line.split()[:3]
+                                       for line in vertex_lines], dtype=float)
+
+                vertex_chunks.append(values.reshape(-1, 3))
+
+            if polygon_lines:
+                text = OBJ_REFERENCE.sub("", "".join(
+                    line[2:] for line in polygon_lines))
+                indexes = np.fromstring(text, dtype=np.int64, sep=" ")
+
+                # Every face has at least three corners, so if there are
+                # exactly three indexes per line, all faces are triangles.
+                # Negative indexes depend on the vertexes read before each
+                # line and line-elements aren't closed, so they are handled
+                # one line at a time.
+                if len(indexes) == 3 * len(polygon_lines) and \
+                        indexes.min() > 0 and \
+                        all(line[0] == "f" for line in polygon_lines):
+                    edges = polygon_edges(indexes.reshape(-1, 3) - 1)
+
+                else:
+                    edges = []
+                    vertex_total = vertex_count
+                    for line in lines:
+                        if line[:2] == "v ":
+                            vertex_total += 1
+                        elif line[:2] in ("f ", "l "):
+                            polygon = parse_obj_polygon(line, vertex_total)
+                            edges.extend(zip(polygon, polygon[1:]))
+                            if line[0] == "f":
+                                edges.append((polygon[-1], polygon[0]))
+
+                    edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+                # Most duplicate edges are in the same chunk, removing them
+                # here keeps the memory usage down.
+                edge_chunks.append(edge_keys(edges))
+
+            vertex_count += len(vertex_lines)
+
+    return mesh_arrays(vertex_chunks, edge_chunks)
+
+
+def mesh_arrays(vertex_chunks, edge_chunks):
+    # Combines the chunks read by the mesh loaders into the final vertex and
+    # edge arrays and checks that the edges only refer to existing vertexes.
+    # The edge chunks are given as keys returned by edge_keys.
+    if vertex_chunks:
+        vertexes = np.concatenate(vertex_chunks).astype(np.float64)
+    else:
+        vertexes = np.zeros((0, 3))
+
+    keys = np.concatenate(edge_chunks) if edge_chunks else \
+        np.zeros(0, dtype=np.int64)
+    keys.sort()
+    keys = unique_sorted(keys)
+
+    edges = np.stack([keys >> 32, keys & 0xffffffff], axis=1).astype(np.int32)
+
+    if len(edges) and edges[:, 1].max() >= len(vertexes):
+        raise ValueError("mesh has an edge to a vertex that doesn't exist")
+
+    return vertexes, edges
+
+
+def read_ply_header(file):
+    """
+    Reads the header of a PLY-file.
+    :param file file: The PLY-file opened in binary mode.
+    :return: The format of the file ("ascii", "binary_little_endian" or
+             "binary_big_endian") and a list of the file's elements. Every
+             element is a tuple (name, count, properties), where properties
+             is a list of tuples (name, type) for scalar properties and
+             (name, count type, item type) for list properties.
+    """
+
+    if file.readline().strip() != b"ply":
+        raise ValueError("not a PLY-file")
+
+    file_format = None
+    elements = []
+
+    while True:
+        line = file.readline()
+        if not line:
+            raise ValueError("PLY-file ended before end_header")
+
+        words = line.decode("ascii").split()
+
+        if not words or words[0] in ("comment", "obj_info"):
+            continue
+        elif words[0] == "end_header":
+            break
+        elif words[0] == "format":
+            file_format = words[1]
+        elif words[0] == "element":
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == "property" and words[1] == "list":
+            elements[-1][2].append((words[4], words[2], words[3]))
+        elif words[0] == "property":
+            elements[-1][2].append((words[2], words[1]))
+
+    if file_format not in ("ascii", "binary_little_endian",
+                           "binary_big_endian"):
+        raise ValueError("unknown PLY format %s" % file_format)
+
+    return file_format, elements
+
+
+def ply_element_arrays(name, properties, records):
+    # Returns the vertexes or edges found in a chunk of PLY records, that
+    # have been read into a structured numpy array.
+    if name == "vertex":
+        return "vertex", np.stack([records["x"], records["y"], records["z"]],
+                                  axis=1)
+
+    if name == "face":
+        # The vertex indexes are the first list of a face.
+        index_list = [prop for prop in properties if len(prop) == 3][0]
+        return "edge", polygon_edges(records[index_list[0]])
+
+    if name == "edge":
+        return "edge", np.stack([records["vertex1"], records["vertex2"]],
+                                axis=1)
+
+    return None, None
+
+
+def load_ply(path):
+    """
+    Reads the vertexes and edges of an ASCII or binary PLY-file. The file is
+    read in chunks, so only the resulting arrays need to fit in memory. Edges
+    are taken from the face- and edge-elements of the file.
+    :param str path: Path of the file.
+    :return: The vertexes as a float64 numpy array of shape (n, 3) and the
+             unique edges as an int32 numpy array of shape (m, 2).
+    """
+
+    chunks = {"vertex": [], "edge": []}
+
+    with open(path, "rb") as file:
+        file_format, elements = read_ply_header(file)
+        byte_order = "<" if file_format == "binary_little_endian" else ">"
+
+        for name, count, properties in elements:
+            read = 0
+            while read < count:
+                chunk_size = min(count - read, MESH_CHUNK_RECORDS)
+
+                if file_format == "ascii":
+                    records = read_ply_ascii_records(file, properties,
+                                                     chunk_size)
+                else:
+                    records = read_ply_binary_records(file, properties,
+                                                      chunk_size, byte_order)
+
+                kind, array = ply_element_arrays(name, properties, records)
+                if kind == "vertex":
+                    chunks[kind].append(array)
+                elif kind == "edge":
+                    chunks[kind].append(edge_keys(array))
+
+                read += chunk_size
+
+    return mesh_arrays(chunks["vertex"], chunks["edge"])
+
+
+def ply_dtype(properties, byte_order, list_length=None):
+    # Returns a numpy dtype for PLY records. All list properties are assumed
+    # to have list_length items.
+    fields = []
+
+    for prop in properties:
+        if len(prop) == 3:
+            fields.append((prop[0] + "_count", byte_order + PLY_TYPES[prop[1]]))
+            fields.append((prop[0], byte_order + PLY_TYPES[prop[2]],
+                           (list_length,)))
+        else:
+            fields.append((prop[0], byte_order + PLY_TYPES[prop[1]]))
+
+    return np.dtype(fields)
+
+
+def read_ply_binary_records(file, properties, count, byte_order):
+    """
+    Reads records of one PLY element from a binary file.
+    :param file file: The PLY-file, positioned at the first record.
+    :param list properties: The properties of the element.
+    :param int count: The number of records to be read.
+    :param str byte_order: "<" for little endian or ">" for big endian.
+    :return: The records as a structured numpy array. Lists are read into
+             2-dimensional fields. If the lists are of different lengths, only
+             the first list property is kept and its lists are padded by
+             repeating their last item.
+    """
+
+    list_properties = [prop for prop in properties if len(prop) == 3]
+
+    if not list_properties:
+        dtype = ply_dtype(properties, byte_order)
+        return read_ply_exactly(file, dtype, count)
+
+    # Faces are usually all triangles or all quads, so the records are read
+    # at once by assuming that all lists have the same length as the first.
+    start = file.tell()
+    prefix = ply_dtype(properties[:properties.index(list_properties[0])] +
+                       [(list_properties[0][0], list_properties[0][1])],
+                       byte_order)
+    first = read_ply_exactly(file, prefix, 1)
+    list_length = int(first[list_properties[0][0]][0])
+    file.seek(start)
+
+    dtype = ply_dtype(properties, byte_order, list_length)
+    records = np.fromfile(file, dtype=dtype, count=count)
+
+    if len(records) == count and all(
+            (records[prop[0] + "_count"] == list_length).all()
+            for prop in list_properties):
+        return records
+
+    # Lists of different lengths have to be read one record at a time.
+    file.seek(start)
+    lists = []
+
+    for i in range(count):
+        for prop in properties:
+            if len(prop) == 3:
+                length = int(read_ply_exactly(
+                    file, np.dtype(byte_order + PLY_TYPES[prop[1]]), 1)[0])
+                items = read_ply_exactly(
+                    file, np.dtype(byte_order + PLY_TYPES[prop[2]]), length)
+                if prop is list_properties[0]:
+                    lists.append(items)
+            else:
+                read_ply_exactly(file,
+                                 np.dtype(byte_order + PLY_TYPES[prop[1]]), 1)
+
+    return padded_list_records(list_properties[0][0], lists)
+
+
+def read_ply_exactly(file, dtype, count):
+    # Reads count items of given dtype and raises an error if the file ends.
+    data = file.read(dtype.itemsize * count)
+    if len(data) != dtype.itemsize * count:
+        raise ValueError("PLY-file ended unexpectedly")
+
+    return np.frombuffer(data, dtype=dtype)
+
+
+def padded_list_records(name, lists):
+    # Returns lists of different lengths as a structured array with one
+    # 2-dimensional field. Shorter lists are padded by repeating their last
+    # item, which only adds edges from a point to itself.
+    length = max(len(items) for items in lists)
+    records = np.zeros(len(lists), dtype=[(name, np.int64, (length,))])
+
+    for i, items in enumerate(lists):
+        records[name][i, :len(items)] = items
+        records[name][i, len(items):] = items[-1]
+
+    return records
+
+
+def read_ply_ascii_records(file, properties, count):
+    """
+    Reads records of one PLY element from an ASCII file.
+    :param file file: The PLY-file, positioned at the first record.
+    :param list properties: The properties of the element.
+    :param int count: The number of records to be read.
+    :return: The records as a structured numpy array, like
+             read_ply_binary_records.
+    """
+
+    lines = [file.readline() for i in range(count)]
+    if lines and not lines[-1]:
+        raise ValueError("PLY-file ended unexpectedly")
+
+    values = np.fromstring(b"".join(lines).decode("ascii"), sep=" ")
+
+    list_properties = [prop for prop in properties if len(prop) == 3]
+
+    if not list_properties:
+        dtype = ply_dtype(properties, "=")
+        values = values.reshape(count, len(properties))
+        records = np.zeros(count, dtype=dtype)
+        for i, prop in enumerate(properties):
+            records[prop[0]] = values[:, i]
+        return records
+
+    # The same assumption as with binary files: all lists are as long as the
+    # first one.
+    list_index = properties.index(list_properties[0])
+    list_length = int(lines[0].split()[list_index])
+    record_length = len(properties) + list_length * len(list_properties)
+
+    if len(values) == count * record_length:
+        values = values.reshape(count, record_length)
+        if (values[:, list_index] == list_length).all():
+            items = values[:, list_index + 1:list_index + 1 + list_length]
+            records = np.zeros(count, dtype=[(list_properties[0][0],
+                                              np.int64, (list_length,))])
+            records[list_properties[0][0]] = items
+            return records
+
+    lists = []
+    for line in lines:
+        words = line.split()
+        length = int(words[list_index])
+        lists.append([int(word) for word in
+                      words[list_index + 1:list_index + 1 + length]])
+
+    return padded_list_records(list_properties[0][0], lists)
+
+
+def load_stl(path):
+    """
+    Reads the vertexes and edges of a binary STL-file. STL-files store every
+    triangle separately, so vertexes shared by triangles are merged.
+    :param str path: Path of the file.
+    :return: The vertexes as a float64 numpy array of shape (n, 3) and the
+             unique edges as an int32 numpy array of shape (m, 2).
+    """
+
+    triangle_dtype = np.dtype([("normal", "<f4", (3,)),
+                               ("vertexes", "<f4", (3, 3)),
+                               ("attribute", "<u2")])
+
+    with open(path, "rb") as file:
+        file.read(80)    # The header isn't used.
+        count = int(np.frombuffer(file.read(4), dtype="<u4")[0])
+
+        if os.path.getsize(path) != 84 + count * triangle_dtype.itemsize:
+            raise ValueError("only binary STL-files are supported")
+
+        corners = np.empty((count * 3, 3), dtype=np.float32)
+        read = 0
+        while read < count:
+            chunk_size = min(count - read, MESH_CHUNK_RECORDS)
+            triangles = np.fromfile(file, dtype=triangle_dtype,
+                                    count=chunk_size)
+            corners[read * 3:(read + chunk_size) * 3] = \
+                triangles["vertexes"].reshape(-1, 3)
+            read += chunk_size
+
+    # Equal corners are merged by sorting them by their raw bits, after that
+    # equal corners are next to each other.
+    bits = corners.view(np.int32)
+    order = np.lexsort((bits[:, 2], bits[:, 1], bits[:, 0]))
+    sorted_bits = bits[order]
+    first = np.ones(len(corners), dtype=bool)
+    first[1:] = (sorted_bits[1:] != sorted_bits[:-1]).any(axis=1)
+
+    indexes = np.empty(len(corners), dtype=np.int64)
+    indexes[order] = np.cumsum(first) - 1
+    vertexes = corners[order[first]]
+
+    edges = polygon_edges(indexes.reshape(-1, 3))
+
+    return mesh_arrays([vertexes], [edge_keys(edges)])
+
+
+def load_mesh(path):
+    """
+    Reads a mesh from a file. The file type is chosen by the file extension:
+    ".obj" for Wavefront OBJ, ".ply" for PLY and ".stl" for binary STL.
+    :param str path: Path of the file.
+    :return: The vertexes as a float64 numpy array of shape (n, 3) and the
+             unique edges as an int32 numpy array of shape (m, 2). These can
+             be given to Object as they are.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".obj":
+        return load_obj(path)
+    elif extension == ".ply":
+        return load_ply(path)
+    elif extension == ".stl":
+        return load_stl(path)
+
+    raise ValueError("unknown mesh file type %s" % extension)
+
+
+def normalize_vertexes(vertexes, radius=sqrt(3)):
+    """
+    Moves the vertexes so that their center is at the origin and scales them
+    so that the furthest vertex is at given distance from the center. Meshes
+    can be in any units, this makes them the same size as the pre-defined
+    objects.
+    :param numpy array vertexes: The vertexes, shape (n, 3).
+    :param float radius: The distance of the furthest vertex from the center.
+    :return: The normalized vertexes as a new numpy array.
+    """
+
+    vertexes = np.asarray(vertexes, dtype=np.float64)
+    if len(vertexes) == 0:
+        return vertexes.copy()
+
+    center = (vertexes.max(axis=0) + vertexes.min(axis=0)) / 2
+    vertexes = vertexes - center
+    furthest = np.sqrt((vertexes ** 2).sum(axis=1)).max()
+
+    if furthest > 0:
+        vertexes *= radius / furthest
+
+    return vertexes
+
+
+def simplify_mesh(vertexes, edges, cell_size):
+    """
+    Simplifies a mesh by vertex clustering. The space is divided into cubic
+    cells and all vertexes inside a cell are merged into one vertex at their
+    mean position. Edges between merged vertexes are removed and duplicate
+    edges are combined, so no vertex moves more than the cell's diagonal.
+    :param numpy array vertexes: The vertexes of the mesh, shape (n, 3).
+    :param numpy array edges: The edges of the mesh, shape (m, 2).
+    :param float cell_size: The length of a cell's side.
+    :return: The simplified vertexes as a numpy array of shape (k, 3) and
+             edges as an int32 numpy array of shape (l, 2).
+    """
+
+    vertexes = np.asarray(vertexes, dtype=np.float64).reshape(-1, 3)
+    if len(vertexes) == 0:
+        return vertexes.copy(), np.zeros((0, 2), dtype=np.int32)
+
+    cells = np.floor(vertexes / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    dimensions = cells.max(axis=0) + 1
+
+    keys = (cells[:, 0] * dimensions[1] + cells[:, 1]) * dimensions[2] \
+        + cells[:, 2]
+    clusters = np.unique(keys, return_inverse=True)[1].reshape(-1)
+
+    counts = np.bincount(clusters)
+    simplified = np.stack([np.bincount(clusters, weights=vertexes[:, axis])
+                           for axis in range(3)], axis=1) / counts[:, np.newaxis]
+
+    keys = edge_keys(clusters[np.asarray(edges, dtype=np.int64)])
+    edges = np.stack([keys >> 32, keys & 0xffffffff], axis=1).astype(np.int32)
+
+    return simplified, edges
+
+
+def extremal_vertexes(vertexes, direction_count=None):
+    """
+    Finds the vertexes that are furthest in evenly spread directions. These
+    are vertexes of the convex hull, and however the object is rotated and
+    projected, its extreme points on the canvas are among them or very close
+    to them. Small objects keep all of their vertexes.
+    :param numpy array vertexes: The vertexes, shape (n, 3).
+    :param int direction_count: The number of directions. Defaults to
+           BOUNDS_DIRECTIONS.
+    :return: The indexes of the extremal vertexes as a sorted numpy array.
+    """
+
+    if direction_count is None:
+        direction_count = BOUNDS_DIRECTIONS
+
+    vertexes = np.asarray(vertexes, dtype=np.float64).reshape(-1, 3)
+    if len(vertexes) <= direction_count:
+        return np.arange(len(vertexes))
+
+    # The directions are spread over a sphere along a Fibonacci spiral.
+    i = np.arange(direction_count) + 0.5
+    z = 1 - 2 * i / direction_count
+    angles = pi * (1 + sqrt(5)) * i
+    directions = np.stack([np.sqrt(1 - z ** 2) * np.cos(angles),
+                           np.sqrt(1 - z ** 2) * np.sin(angles), z], axis=1)
+
+    # The vertexes are handled in chunks, so that the distances of all
+    # vertexes in all directions don't need to fit in memory at once. Each
+    # row of distances belongs to one direction.
+    best = np.full(direction_count, -np.inf)
+    extremes = np.zeros(direction_count, dtype=np.int64)
+    chunk_size = 1 << 16
+
+    for start in range(0, len(vertexes), chunk_size):
+        distances = directions @ vertexes[start:start + chunk_size].T
+        furthest = distances.argmax(axis=1)
+        values = distances[np.arange(direction_count), furthest]
+
+        better = values > best
+        best[better] = values[better]
+        extremes[better] = furthest[better] + start
+
+    return np.unique(extremes)
+
+
+def convex_faces(vertexes, tolerance=1e-6):
+    """
+    Finds the faces of a convex polyhedron. Every plane through three of the
+    vertexes, that has all vertexes on the same side of it, is a face and all
+    vertexes on that plane are its corners.
+    :param numpy array vertexes: The vertexes of the polyhedron, shape (n, 3).
+    :param float tolerance: The largest distance from a plane, relative to
+           the size of the polyhedron, at which a vertex is on the plane.
+    :return: The faces as a list of tuples of vertex indexes. The corners of a
+             face are in counter-clockwise order seen from outside.
+    """
+
+    vertexes = np.asarray(vertexes, dtype=np.float64).reshape(-1, 3)
+    if len(vertexes) < 4:
+        return []
+
+    tolerance *= np.abs(vertexes).max()
+
+    triples = np.array(list(itertools.combinations(range(len(vertexes)), 3)))
+    a, b, c = (vertexes[triples[:, i]] for i in range(3))
+    normals = np.cross(b - a, c - a)
+
+    lengths = np.sqrt((normals ** 2).sum(axis=1))
+    planes = lengths > tolerance
+    triples = triples[planes]
+    normals = normals[planes] / lengths[planes, np.newaxis]
+
+    # The distance of every vertex from every plane.
+    distances = vertexes @ normals.T \
+        - (vertexes[triples[:, 0]] * normals).sum(axis=1)
+
+    # The normals are turned to point away from the other vertexes.
+    flip = distances.max(axis=0) > tolerance
+    normals[flip] *= -1
+    distances[:, flip] *= -1
+
+    faces = {}
+
+    for plane in np.flatnonzero(distances.max(axis=0) <= tolerance):
+        corners = np.flatnonzero(np.abs(distances[:, plane]) <= tolerance)
+        key = tuple(corners.tolist())
+
+        if key in faces:
+            continue
+
+        # The corners are sorted by their angle around the face's center.
+        normal = normals[plane]
+        relative = vertexes[corners] - vertexes[corners].mean(axis=0)
+        u = relative[0]
+        w = np.cross(normal, u)
+        angles = np.arctan2(relative @ w, relative @ u)
+
+        faces[key] = tuple(corners[np.argsort(angles)].tolist())
+
+    return list(faces.values())
+
+
+def predefined_faces(name):
+    """
+    Finds the faces of a pre-defined shape. The faces of each shape are
+    found only once and kept in PREDEFINED_FACES.
+    :param str name: The name of the shape in PREDEFINED_SHAPES.
+    :return: The faces as returned by convex_faces, or None if there is no
+             pre-defined shape with the name.
+    """
+
+    if name not in PREDEFINED_FACES:
+        if name not in PREDEFINED_SHAPES:
+            return None
+
+        PREDEFINED_FACES[name] = convex_faces(PREDEFINED_SHAPES[name][0])
+
+    return PREDEFINED_FACES[name]
+
+
+def face_edge_structure(vertexes, edges, faces):
+    """
+    Prepares the faces of an object for culling the edges behind it. The faces
+    are split into triangles, that are used to find out which way a face is
+    turned after the rotation and projection, and the edges are matched with
+    the faces they border. Faces are turned so that their corners are in
+    counter-clockwise order seen from outside, that is seen from the opposite
+    side than the object's center.
+    :param numpy array vertexes: The vertexes of the object, shape (n, 3).
+    :param numpy array edges: The edges of the object, shape (m, 2).
+    :param list faces: The faces as lists of at least three vertex indexes.
+    :return: A tuple (triangles, triangle_faces, face_count, pair_faces,
+             pair_edges, faceless), where triangles is an array of vertex
+             indexes of shape (t, 3), triangle_faces contains the face of each
+             triangle, pair_faces and pair_edges list every face and edge
+             that border each other and faceless tells which edges don't
+             border any face.
+    """
+
+    vertexes = np.asarray(vertexes, dtype=np.float64).reshape(-1, 3)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+    triangles = []
+    triangle_faces = []
+    borders = []
+    border_faces = []
+    center = vertexes.mean(axis=0) if len(vertexes) else np.zeros(3)
+
+    for face_index, face in enumerate(faces):
+        face = [int(corner) for corner in face]
+
+        if len(face) < 3 or min(face) < 0 or max(face) >= len(vertexes):
+            raise ValueError("face %s isn't made of at least three vertexes "
+                             "of the object" % (tuple(face),))
+
+        corners = vertexes[face]
+        normal = np.cross(corners[1:-1] - corners[0],
+                          corners[2:] - corners[0]).sum(axis=0)
+
+        if normal @ (corners.mean(axis=0) - center) < 0:
+            face.reverse()
+
+        for i in range(1, len(face) - 1):
+            triangles.append((face[0], face[i], face[i + 1]))
+            triangle_faces.append(face_index)
+
+        borders.extend(zip(face, face[1:] + face[:1]))
+        border_faces.extend([face_index] * len(face))
+
+    # The borders of the faces are matched with the object's edges by their
+    # keys, like in edge_keys.
+    def keys(pairs):
+        pairs = np.sort(np.asarray(pairs, dtype=np.int64).reshape(-1, 2),
+                        axis=1)
+        return (pairs[:, 0] << 32) | pairs[:, 1]
+
+    edge_order = np.argsort(keys(edges), kind="stable")
+    sorted_keys = keys(edges)[edge_order]
+    border_keys = keys(borders)
+
+    if len(sorted_keys):
+        positions = np.minimum(np.searchsorted(sorted_keys, border_keys),
+                               len(sorted_keys) - 1)
+        found = sorted_keys[positions] == border_keys
+    else:
+        positions = np.zeros(len(border_keys), dtype=np.int64)
+        found = np.zeros(len(border_keys), dtype=bool)
+
+    pair_faces = np.asarray(border_faces, dtype=np.int64)[found]
+    pair_edges = edge_order[positions[found]]
+
+    faceless = np.ones(len(edges), dtype=bool)
+    faceless[pair_edges] = False
+
+    return (np.asarray(triangles, dtype=np.int64).reshape(-1, 3),
+            np.asarray(triangle_faces, dtype=np.int64), len(faces),
+            pair_faces, pair_edges, faceless)
+
+
+def hex_color(rgb):
+    """
+    Converts an RGB-color to the hexadecimal form Tk takes in.
+    :param tuple rgb: The color as a (R, G, B) tuple of integers.
+    :return: The color as a string, like "#ff8000".
+    """
+
+    return "#" + HEX_BYTES[rgb[0]] + HEX_BYTES[rgb[1]] + HEX_BYTES[rgb[2]]
+
+
+def chameleon_palette(color):
+    """
+    Precomputes the colors an object goes through in chameleon mode. Each
+    color-value is increased by one on every frame until it reaches 255, then
+    decreased until it reaches 0 and so on, so the colors repeat after
+    CHAMELEON_PERIOD frames.
+    :param tuple color: The RGB-color the cycle starts from.
+    :return: A tuple (rgb, fills), where rgb is an int numpy array of shape
+             (CHAMELEON_PERIOD, 3) containing the colors and fills is a list
+             of the same colors in hexadecimal.
+    """
+
+    # Every color-value is at some position of the same 0...255...1 cycle,
+    # that starts at the value itself because the values start increasing.
+    positions = (np.asarray(color, dtype=int).reshape(1, 3)
+                 + np.arange(CHAMELEON_PERIOD).reshape(-1, 1)) \
+        % CHAMELEON_PERIOD
+    rgb = np.where(positions <= 255, positions, CHAMELEON_PERIOD - positions)
+
+    return rgb, [hex_color(values) for values in rgb.tolist()]
+
+
+class MeshData:
+    # This class keeps what is derived from a mesh regardless of how it is
+    # drawn: the distance of the furthest vertex, the extremal vertexes, the
+    # simplified levels of detail and the faces prepared for culling. Each of
+    # them is found when it's first needed. Objects made from the same
+    # arrays share one MeshData through mesh_data_cache, so a scene of many
+    # copies of a large mesh only prepares it once.
+
+    def __init__(self, vertexes, edges):
+        """
+        :param list vertexes: The points of the mesh as (x, y, z) tuples or a
+               numpy array of shape (n, 3). They are stored as a contiguous
+               float64 array.
+        :param list edges: The edges of the mesh as index pairs or a numpy
+               array of shape (m, 2). They are stored as a contiguous int32
+               array.
+
+        Additionally the derived data is kept once it has been found:
+
+        :param float radius: The distance of the furthest vertex from the
+               origin, or None.
+        :param numpy array bound_indexes: The indexes of the extremal
+               vertexes as returned by extremal_vertexes, or None.
+        :param dict detail_levels: The simplified meshes that have been
+               needed so far as (vertexes, edges) tuples. The keys are the
+               binary logarithms of the cell sizes given to simplify_mesh.
+        :param tuple faces: The latest faces given to face_structure and
+               their structure as (faces, structure), or None.
+        """
+
+        self.__vertexes = np.ascontiguousarray(vertexes,
+                                               dtype=np.float64).reshape(-1, 3)
+        self.__edges = np.ascontiguousarray(edges, dtype=np.int32).reshape(-1, 2)
+        self.__radius = None
+        self.__bound_indexes = None
+        self.__detail_levels = {}
+        self.__faces = None
+
+    def vertexes(self):
+        return self.__vertexes
+
+    def edges(self):
+        return self.__edges
+
+    def radius(self):
+        # Returns the distance of the furthest vertex from the origin.
+        if self.__radius is None:
+            self.__radius = float(np.sqrt((self.__vertexes ** 2)
+                                          .sum(axis=1)).max()) \
+                if len(self.__vertexes) else 0.0
+
+        return self.__radius
+
+    def bound_indexes(self):
+        # Returns the indexes of the extremal vertexes, that are used to find
+        # an object's extents on the canvas.
+        if self.__bound_indexes is None:
+            self.__bound_indexes = extremal_vertexes(self.__vertexes)
+
+        return self.__bound_indexes
+
+    def detail_level(self, level):
+        """
+        :param int level: The binary logarithm of the cell size the mesh is
+               simplified with, or None for the original mesh.
+        :return: The vertexes and edges of the level as a tuple. Levels that
+                 don't drop at least a quarter of the edges use the original
+                 mesh.
+        """
+
+        if level is None:
+            return self.__vertexes, self.__edges
+
+        if level not in self.__detail_levels:
+            mesh = simplify_mesh(self.__vertexes, self.__edges, 2.0 ** level)
+
+            if len(mesh[1]) > len(self.__edges) * 3 / 4:
+                mesh = self.__vertexes, self.__edges
+
+            self.__detail_levels[level] = mesh
+
+        return self.__detail_levels[level]
+
+    def face_structure(self, faces):
+        """
+        Prepares given faces of the mesh for culling, see
+        face_edge_structure. The structure of the latest faces is kept, so
+        objects given the same list of faces share it.
+        :param list faces: The faces as lists of vertex indexes.
+        :return: The structure returned by face_edge_structure.
+        """
+
+        if self.__faces is None or self.__faces[0] is not faces:
+            self.__faces = faces, face_edge_structure(self.__vertexes,
+                                                      self.__edges, faces)
+
+        return self.__faces[1]
+
+
+class MeshDataCache:
+    # This class keeps the MeshData of the latest meshes objects have been
+    # made from. A mesh is recognized by the identity of its vertex and edge
+    # arrays, so the arrays must not be changed after an object has been
+    # made from them. The arrays are referenced by the cache, so their ids
+    # can't be reused while they are in it.
+
+    def __init__(self, capacity):
+        """
+        :param int capacity: The number of meshes kept in the cache. The mesh
+               that has been used longest ago is dropped first.
+        """
+
+        self.__capacity = capacity
+        self.__meshes = collections.OrderedDict()
+
+    def mesh(self, vertexes, edges):
+        """
+        Returns the MeshData of given vertexes and edges, the same instance
+        for the same arrays.
+        :param list vertexes: The vertexes given to Object.
+        :param list edges: The edges given to Object.
+        :return: MeshData
+        """
+
+        key = id(vertexes), id(edges)
+
+        entry = self.__meshes.get(key)
+        if entry is not None:
+            self.__meshes.move_to_end(key)
+            return entry[2]
+
+        mesh = MeshData(vertexes, edges)
+        self.__meshes[key] = vertexes, edges, mesh
+
+        if len(self.__meshes) > self.__capacity:
+            self.__meshes.popitem(last=False)
+
+        return mesh
+
+    def clear(self):
+        # Drops all meshes from the cache.
+        self.__meshes.clear()
+
+
+class Object:
+    # This class is used to define a 3d object that can be drawn on a canvas.
+    # The object will consist of given points that will be connected with
+    # lines. The points and edges are stored in numpy arrays and the object's
+    # other attributes in slots instead of an instance dictionary.
+
+    __slots__ = ("__vertexes", "__edges", "__canvas_width", "__canvas_height",
+                 "__size", "__color", "__chameleon_mode_setting",
+                 "__thickness", "__velocity", "__x_rotation", "__y_rotation",
+                 "__z_rotation", "__x_pos", "__y_pos", "__x_offset",
+                 "__y_offset", "__x_inc", "__y_inc",
+                 "__x_degree", "__y_degree", "__z_degree", "__color_mode",
+                 "__palette", "__palette_rgb", "__color_index",
+                 "__gradient_bands", "__depth_cue", "__point_cloud",
+                 "__z_pos", "__z_inc",
+                 "__mesh", "__detail_vertexes", "__detail_edges",
+                 "__rotation", "__projector",
+                 "__projection_count", "__drawn_state", "__faces",
+                 "__back_face_culling", "__camera", "__drawn_edge_count",
+                 "__tag", "__band_items", "__band_shown", "__band_styles",
+                 "__line_canvas")
+
+    def __init__(self, vertexes, edges, canvas_width, canvas_height, size,
+                 color, chameleon_mode, thickness, velocity, x_rotation,
+                 y_rotation, z_rotation, faces=None, back_face_culling=False,
+                 camera=None, color_mode="solid", depth_cue=False,
+                 point_cloud=False):
+
+        """
+        :param list vertexes: List of points that are used to make the object.
+               All points are given as tuples that contain the coordinates
+               (x, y, z), or as a numpy array of shape (n, 3). The points are
+               stored as a contiguous float64 array in the object's MeshData.
+        :param list edges: List of edges that make the object. Each edge is a
+               tuple containing the index of the points to be connected
+               (p1, p2), or a numpy array of shape (m, 2). The edges are
+               stored as a contiguous int32 array in the object's MeshData.
+        :param int canvas_width: The width of the canvas the object will be
+               drawn on.
+        :param int canvas_height: The height of the canvas the object will be
+               drawn on.
+        :param float size: A float that is used to determinate the size of the
+               object. The object's points are multiplied by it before they
+               are looked at with the camera.
+        :param tuple color: The RGB-color of the object as a (R, G, B) tuple.
+        :param boolean chameleon_mode_setting: If chameleon_mode is set to 
+               True, the object's color will vary.
+        :param int thickness: The thickness of the lines that make the object.
+        :param float velocity: The velocity of the object's movement.
+        :param float x_rotation: Rotation speed around the object's x-axis.
+               If set to 0, there will be no rotation around the x-axis.
+        :param float y_rotation: Rotation speed around the object's y-axis.
+               If set to 0, there will be no rotation around the y-axis.
+        :param float z_rotation: Rotation speed around the object's z-axis.
+               If set to 0, there will be no rotation around the z-axis.
+        :param list faces: The faces of the object as lists of vertex
+               indexes, or None if the faces aren't known. The faces are
+               stored as returned by face_edge_structure.
+        :param boolean back_face_culling: If set to True and the object has
+               faces, the edges that only border faces turned away from the
+               viewer aren't drawn.
+        :param Camera camera: The camera the object is looked at with. If
+               None, default_camera is used.
+        :param str color_mode: One of COLOR_MODES. In "solid" mode all edges
+               have the object's color, in "gradient" mode the color changes
+               along the object's y-axis and in "depth" mode the edges
+               further away from the viewer are darker.
+        :param boolean depth_cue: If set to True, the edges further away from
+               the viewer are drawn darker and thinner, in DEPTH_CUE_LEVELS
+               steps.
+        :param boolean point_cloud: If set to True, the vertexes are drawn
+               instead of the edges, which aren't needed. The vertexes are
+               counted in cells of the canvas and every cell that has
+               vertexes is drawn, shaded by the number of vertexes in it.
+
+        Additionally few more parameters will be needed to construct the
+        object:
+
+        :param float x_pos: The x-coordinate of the center position of the
+               object.
+        :param float y_pos: The y-coordinate of the center position of the
+               object.
+        :param float x_offset: The x-distance of a non-moving object's
+               center from the center of the canvas.
+        :param float y_offset: The y-distance of a non-moving object's
+               center from the center of the canvas.
+        :param boolean x_inc: If set to True, the object's x_pos will get
+               bigger, if set to False, the object's x_pos will get smaller.
+        :param boolean y_inc: If set to True, the object's y_pos will get
+               bigger, if set to False, the object's y_pos will get smaller.
+
+        x- and y_inc will be used to determinate the movement of the object.
+        At the beginning both will be chosen by random.
+
+        :param float x_degree: The degree of rotation around the object's
+               x-axis. If x_rotation > 0, x_rotation will be added to x_degree
+               every time the object moves on the canvas.
+        :param float y_degree: The degree of rotation around the object's
+               y-axis. If y_rotation > 0, y_rotation will be added to y_degree
+               every time the object moves on the canvas.
+        :param float z_degree: The degree of rotation around the object's
+               z-axis. If z_rotation > 0, z_rotation will be added to z_degree
+               every time the object moves on the canvas.
+        :param list palette: The colors of the object's chameleon mode cycle
+               in hexadecimal, as returned by chameleon_palette.
+        :param numpy array palette_rgb: The same colors as RGB-values.
+        :param int color_index: The index of the object's current color in
+               palette. It is only changed in chameleon mode.
+        :param tuple gradient_bands: The detail edges and the gradient band of
+               each of them, or None if they haven't been needed yet.
+        :param MeshData mesh: The data derived from the object's vertexes and
+               edges, shared with other objects made from the same arrays.
+        :param numpy array detail_vertexes: The vertexes of the level of
+               detail that is currently drawn.
+        :param numpy array detail_edges: The edges of the level of detail that
+               is currently drawn.
+        :param tuple rotation: The combined rotation matrix of the current
+               rotation degrees as returned by TransformCache.rotation, or
+               None if the degrees have changed since it was last needed.
+        :param ParallelProjector projector: Projects the vertexes with worker
+               processes if parallel projection is used, otherwise None.
+        :param int projection_count: The number of vertex projections made
+               during the latest draw. With batch projection every vertex is
+               projected once per frame. The object's extents are read from
+               the same projection, only simplified levels of detail project
+               the extremal vertexes separately.
+        :param tuple drawn_state: The object's state when it was last drawn
+               as returned by render_state, or None if it hasn't been drawn.
+        :param str tag: Canvas tag shared by all of the object's line items.
+        :param list band_items: Canvas item ids of the object's lines, used
+               when retained rendering is enabled. Every color the object is
+               drawn with has its own list of items.
+        :param list band_shown: The number of items in each list of
+               band_items that are currently shown, the rest are hidden.
+        :param list band_styles: The color and width each list of band_items
+               was last configured with.
+        :param tkinter Canvas widget line_canvas: The canvas that band_items
+               belong to.
+        :param int drawn_edge_count: The number of edges drawn during the
+               latest draw, after culling and clipping.
+        """
+
+        self.__mesh = mesh_data_cache.mesh(vertexes, edges)
+        self.__vertexes = self.__mesh.vertexes()
+        self.__edges = self.__mesh.edges()
+        self.__canvas_width = canvas_width
+        self.__canvas_height = canvas_height
+        self.__size = size
+        self.__color = color
+        self.__chameleon_mode_setting = chameleon_mode
+        self.__thickness = thickness
+        self.__velocity = velocity
+        self.__x_rotation = x_rotation
+        self.__y_rotation = y_rotation
+        self.__z_rotation = z_rotation
+
+        self.__x_pos = canvas_width/2
+        self.__y_pos = canvas_height/2
+        self.__x_offset = 0
+        self.__y_offset = 0
+        self.__x_inc = random.choice([True, False])
+        self.__y_inc = random.choice([True, False])
+        self.__x_degree = 0
+        self.__y_degree = 0
+        self.__z_degree = 0
+        self.__color_mode = color_mode
+        self.__palette_rgb, self.__palette = chameleon_palette(color)
+        self.__color_index = 0
+        self.__gradient_bands = None
+        self.__depth_cue = depth_cue
+        self.__point_cloud = point_cloud
+
+        self.__z_pos = 0
+        self.__z_inc = False
+
+        self.__detail_vertexes = self.__vertexes
+        self.__detail_edges = self.__edges
+
+        self.__faces = None
+        if faces is not None and len(faces):
+            self.__faces = self.__mesh.face_structure(faces)
+        self.__back_face_culling = back_face_culling
+        self.__camera = camera
+        self.__drawn_edge_count = 0
+
+        self.__rotation = None
+        self.__projector = None
+        self.__projection_count = 0
+        self.__drawn_state = None
+
+        self.__tag = "object%d" % id(self)
+        self.__band_items = []
+        self.__band_shown = []
+        self.__band_styles = []
+        self.__line_canvas = None
+
+    def proj(self, point):
+        """
+        This function is used to rotate the object's three-dimensional point
+        around x-, y- and z-axis, if rotation parameters are set higher than 0.
+        After the rotations, it will project the 3D point into 2D space and
+        return the result.
+        :param tuple point: One of the object's points as a tuple (x, y, z)
+        :return: The final projected point as a tuple that contains the points
+                coordinates on the canvas (x, y), or None if the point is
+                outside the camera's depth range.
+        """
+
+        # The x-, y- and z-rotations are combined into one matrix, that is
+        # only calculated when the rotation degrees change. If the object
+        # doesn't rotate, the matrix is an identity matrix.
+        result_point = matrix_multiplication(self.rotation_rows(), point)
+
+        self.__projection_count += 1
+
+        # The point is scaled by the object's size and projected to 2D space
+        # with the camera. Points in front of the near plane or behind the
+        # far plane aren't drawn.
+        projected = self.camera().project_point(
+            [coordinate * self.__size for coordinate in result_point])
+
+        if projected is None:
+            return None
+
+        x, y = projected
+
+        # The point's final position will also depend on the object's center,
+        # therefore the centerpoint's coordinates will be added.
+        x += self.__x_pos
+        y += self.__y_pos
+
+        return int(x), int(y)
+
+    def project_vertexes(self):
+        """
+        Rotates and projects all of the object's vertexes into 2D space. The
+        rotation matrices are composed only once and all vertexes are handled
+        with a single matrix multiplication. The result doesn't include the
+        object's position, so the same buffer can be used both before and
+        after the object has been moved. Objects with at least
+        PARALLEL_PROJECTION_MIN_VERTEXES vertexes are projected with a
+        ParallelProjector if parallel projection is used.
+        :return: The projected points relative to the object's center as a
+                 float numpy array of shape (n, 2). The points outside the
+                 camera's depth range are NaN.
+        """
+
+        vertexes = self.__detail_vertexes
+        projector = self.parallel_projector()
+
+        self.__projection_count += len(vertexes)
+
+        if projector is not None:
+            return projector.project(self.rotation_matrix(), self.__size,
+                                     self.camera())
+
+        return self.camera().project(self.camera_points(vertexes))
+
+    def parallel_projector(self):
+        """
+        Returns the ParallelProjector the object's current level of detail is
+        projected with. The projector is created when it's first needed.
+        :return: The ParallelProjector, or None if parallel projection isn't
+                 used or the object has less than
+                 PARALLEL_PROJECTION_MIN_VERTEXES vertexes.
+        """
+
+        if not parallel_projection or \
+                len(self.__detail_vertexes) < PARALLEL_PROJECTION_MIN_VERTEXES:
+            return None
+
+        if self.__projector is None:
+            self.__projector = ParallelProjector(self.__detail_vertexes)
+
+        return self.__projector
+
+    def camera_points(self, vertexes):
+        """
+        Rotates given vertexes of the object and scales them by the object's
+        size, so that they can be looked at with the camera.
+        :param numpy array vertexes: The vertexes, shape (n, 3).
+        :return: The points relative to the object's center, shape (n, 3).
+        """
+
+        return vertexes @ (self.rotation_matrix().T * self.__size)
+
+    def camera(self):
+        # Returns the camera the object is looked at with.
+        if self.__camera is None:
+            return default_camera
+
+        return self.__camera
+
+    def drawn_edge_count(self):
+        # Returns the number of edges drawn during the latest draw.
+        return self.__drawn_edge_count
+
+    def rotation_matrix(self):
+        """
+        :return: The combined rotation matrix of the object's current rotation
+                 degrees as a 3x3 numpy array.
+        """
+
+        # Rotation degrees of axes that don't rotate stay at 0, so their
+        # matrices are identity matrices and can be included in any case.
+        if self.__rotation is None:
+            self.__rotation = rotation_cache.rotation(
+                self.__x_degree, self.__y_degree, self.__z_degree)
+
+        return self.__rotation[0]
+
+    def rotation_rows(self):
+        # Same as rotation_matrix, but returns the matrix as lists for
+        # matrix_multiplication.
+        self.rotation_matrix()
+        return self.__rotation[1]
+
+    def rotation_degrees(self):
+        # Returns the object's current rotation degrees around x-, y- and
+        # z-axis as a tuple.
+        return self.__x_degree, self.__y_degree, self.__z_degree
+
+    def vertexes(self):
+        # Returns the object's vertexes as a float64 numpy array (n, 3).
+        return self.__vertexes
+
+    def size(self):
+        # Returns the object's size, that is also its projection value.
+        return self.__size
+
+    def set_position(self, x_pos, y_pos):
+        # Moves the object's center to given position on the canvas. A
+        # non-moving object keeps its distance from the canvas center when
+        # the canvas is resized.
+        self.__x_pos = x_pos
+        self.__y_pos = y_pos
+        self.__x_offset = x_pos - self.__canvas_width/2
+        self.__y_offset = y_pos - self.__canvas_height/2
+
+    def detail_mesh(self):
+        # Returns the vertexes and edges of the level of detail that is
+        # currently drawn as a tuple.
+        return self.__detail_vertexes, self.__detail_edges
+
+    def select_detail(self):
+        """
+        Chooses the level of detail the object is drawn with. Objects with at
+        least LOD_MIN_EDGES edges are drawn simplified with simplify_mesh, so
+        that no vertex moves more than LOD_ERROR_PIXELS pixels on the canvas
+        and at most LOD_MAX_EDGES edges are drawn. The simplified meshes are
+        made when they are first needed.
+        :return: The vertexes of the chosen level of detail.
+        """
+
+        level = None
+
+        if LOD_ERROR_PIXELS > 0 and len(self.__edges) >= LOD_MIN_EDGES:
+            # A vertex moves at most a cell's diagonal when the cells are
+            # merged, the camera tells how much that moves its projection.
+            scale = abs(self.__size) * self.camera().scale_bound(
+                abs(self.__size) * self.__mesh.radius())
+            if scale > 0:
+                level = floor(log2(LOD_ERROR_PIXELS / (scale * sqrt(3))))
+
+        mesh = self.detail_level(level)
+
+        # Too many edges are simplified further, even though the error grows.
+        if level is not None and len(mesh[1]) > LOD_MAX_EDGES:
+            level = self.edge_budget_level(level)
+            mesh = self.detail_level(level)
+
+        if mesh[0] is not self.__detail_vertexes:
+            self.__detail_vertexes, self.__detail_edges = mesh
+
+            # The worker processes only have the previous vertexes.
+            if self.__projector is not None:
+                self.__projector.close()
+                self.__projector = None
+
+        return self.__detail_vertexes
+
+    def edge_budget_level(self, level):
+        """
+        Finds the finest level of detail that has at most LOD_MAX_EDGES
+        edges, without simplifying the mesh at every level in between. The
+        search starts from a guess made from the mesh's typical edge length,
+        assuming that the mesh is a surface, so doubling the cell size leaves
+        a quarter of the edges. The guess is corrected with growing steps and
+        the last gap is closed by bisection.
+        :param int level: A level that has too many edges.
+        :return: The level as an int.
+        """
+
+        def within_budget(level):
+            vertexes, edges = self.detail_level(level)
+            return len(edges) <= LOD_MAX_EDGES or len(vertexes) <= 1
+
+        # Cells smaller than the edges don't merge anything, so the edges
+        # have to be a few cells long to be within the budget.
+        sample = self.__edges[::max(1, len(self.__edges) // 10000)]
+        edge_length = np.sqrt(((self.__vertexes[sample[:, 0]]
+                                - self.__vertexes[sample[:, 1]]) ** 2)
+                              .sum(axis=1)).mean()
+        too_many = level
+        guess = level + 1
+
+        if edge_length > 0:
+            guess = max(guess, ceil(log2(edge_length * sqrt(
+                len(self.__edges) / LOD_MAX_EDGES))))
+
+        step = 1
+
+        if within_budget(guess):
+            fitting = guess
+            while fitting - step > too_many and within_budget(fitting - step):
+                fitting -= step
+                step *= 2
+
+            too_many = max(too_many, fitting - step)
+
+        else:
+            too_many = guess
+            while not within_budget(too_many + step):
+                too_many += step
+                step *= 2
+
+            fitting = too_many + step
+
+        while fitting - too_many > 1:
+            middle = (too_many + fitting) // 2
+
+            if within_budget(middle):
+                fitting = middle
+            else:
+                too_many = middle
+
+        return fitting
+
+    def detail_level(self, level):
+        # Returns the vertexes and edges of a level of detail, see
+        # MeshData.detail_level.
+        return self.__mesh.detail_level(level)
+
+    def visible_edges(self, projected=None):
+        """
+        Finds out which edges are drawn when back-face culling is used. A face
+        is turned towards the viewer if its corners are in counter-clockwise
+        order after the projection. Edges that border at least one such face
+        or no face at all are visible.
+        :param numpy array projected: The object's vertexes projected by
+               project_vertexes, or None if they need to be projected here.
+        :return: A boolean numpy array telling which of the detail edges are
+                 visible, or None if all edges are drawn.
+        """
+
+        # The faces belong to the original mesh, the simplified levels of
+        # detail are drawn whole.
+        if not self.__back_face_culling or self.__faces is None or \
+                self.__detail_edges is not self.__edges:
+            return None
+
+        triangles, triangle_faces, face_count, pair_faces, pair_edges, \
+            faceless = self.__faces
+
+        if projected is None:
+            projected = self.project_vertexes()
+
+        a = projected[triangles[:, 0]]
+        ab = projected[triangles[:, 1]] - a
+        ac = projected[triangles[:, 2]] - a
+        areas = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+
+        # Faces that are partly outside the camera's depth range have NaN
+        # areas, their edges are kept and clipped.
+        front = ~(np.bincount(triangle_faces, weights=areas,
+                              minlength=face_count) <= 0)
+
+        visible = faceless.copy()
+        visible[pair_edges[front[pair_faces]]] = True
+
+        return visible
+
+    def render_state(self, canvas):
+        """
+        Collects everything that affects how the object looks on the canvas.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn
+               on.
+        :return: The position, rotation degrees, color and canvas size as a
+                 tuple.
+        """
+
+        return (self.__x_pos, self.__y_pos, self.__x_degree, self.__y_degree,
+                self.__z_degree, self.__color_index, canvas.winfo_width(),
+                canvas.winfo_height())
+
+    def is_animated(self):
+        # Returns True if the object moves, rotates or changes color by
+        # itself, in which case it has to be drawn on every frame.
+        return self.__velocity != 0 or self.__x_rotation > 0 \
+            or self.__y_rotation > 0 or self.__z_rotation > 0 \
+            or bool(self.__chameleon_mode_setting)
+
+    def needs_redraw(self, canvas):
+        """
+        Checks if drawing the object again would change anything, so that
+        the frames of a static object can be skipped.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn
+               on.
+        :return: True if the object is animated or its state has changed
+                 since it was last drawn, for example because the canvas has
+                 been resized.
+        """
+
+        return self.is_animated() \
+            or self.__drawn_state != self.render_state(canvas)
+
+    def screen_points(self, projected):
+        """
+        Moves points returned by project_vertexes to the object's current
+        position on the canvas.
+        :param numpy array projected: Projected points relative to the
+               object's center.
+        :return: The points' coordinates on the canvas as a numpy array of
+                 shape (n, 2). The coordinates are whole numbers, but points
+                 outside the camera's depth range stay NaN.
+        """
+
+        # trunc rounds towards zero just like int() does in proj.
+        return np.trunc(projected + (self.__x_pos, self.__y_pos))
+
+    def projection_count(self):
+        """
+        :return: The number of vertex projections made during the latest
+                 draw.
+        """
+
+        return self.__projection_count
+
+    def point_rotation(self, steps=1):
+        """
+        This function is used to increase the degrees used in object rotation
+        if the corresponding rotation settings are set to be higher than 0.
+        :param float steps: The number of animation steps the rotation is
+               advanced by. The rotation settings are amounts per step.
+        :return: none
+        """
+
+        if self.__x_rotation > 0:
+            self.__x_degree += self.__x_rotation * steps
+            self.__rotation = None
+
+        if self.__y_rotation > 0:
+            self.__y_degree += self.__y_rotation * steps
+            self.__rotation = None
+
+        if self.__z_rotation > 0:
+            self.__z_degree += self.__z_rotation * steps
+            self.__rotation = None
+
+    def max_cordinates(self, projected=None):
+        """
+        This function is used to calculate the object's maximum and minimum
+        coordinates. Only the object's extremal vertexes are used, the
+        extreme points on the canvas are among them. If the frame's projected
+        vertexes are given and contain the whole object, the extremal
+        vertexes are looked up from them instead of being projected again.
+        :param numpy array projected: The frame's points returned by
+               project_vertexes, or None.
+        :return: The maximum and minimum x- and y-coordinates. If none of the
+                 vertexes is in the camera's depth range, the object's center
+                 is returned for all of them.
+        """
+
+        max_x = -inf
+        max_y = -inf
+        min_x = inf
+        min_y = inf
+
+        bound_indexes = self.__mesh.bound_indexes()
+
+        if batch_projection:
+            if projected is not None and \
+                    self.__detail_vertexes is self.__vertexes:
+                points = self.screen_points(projected[bound_indexes])
+            else:
+                # Simplified levels of detail don't contain the extremal
+                # vertexes, so they are projected separately.
+                points = self.screen_points(self.camera().project(
+                    self.camera_points(self.__vertexes[bound_indexes])))
+                self.__projection_count += len(bound_indexes)
+
+            # The points outside the camera's depth range are left out.
+            points = points[~np.isnan(points[:, 0])]
+
+            if len(points):
+                max_x, max_y = points.max(axis=0).tolist()
+                min_x, min_y = points.min(axis=0).tolist()
+
+        else:
+            for vertex in self.__vertexes[bound_indexes]:
+                # Loops over the extremal vertexes, projects them to
+                # 2-dimensional space, and finds the max and min coordinates.
+
+                vertex = self.proj(vertex)
+                if vertex is None:
+                    continue
+
+                max_x = max(max_x, vertex[0])
+                min_x = min(min_x, vertex[0])
+                max_y = max(max_y, vertex[1])
+                min_y = min(min_y, vertex[1])
+
+        if max_x == -inf:
+            return self.__x_pos, self.__x_pos, self.__y_pos, self.__y_pos
+
+        return max_x, min_x, max_y, min_y
+
+    def move_object(self, max_x, min_x, max_y, min_y, steps=1):
+        """
+        This function moves the object's position (the center of the object)
+        on the canvas. This function also checks if any of the object's
+        vertexes touches the edges of the canvas, if this happens, the
+        movement direction will be flipped accordingly.
+        :param float max_x: The object's maximum x-coordinate
+        :param float min_x: The object's minimum x-coordinate
+        :param float max_y: The object's maximum y-coordinate
+        :param float min_y: The object's minimum y-coordinate
+        :param float steps: The number of animation steps the object is moved
+               by. The velocity is the distance moved in one step.
+        :return: none
+        """
+
+        distance = self.__velocity * steps
+
+        if self.__x_inc:
+            self.__x_pos += distance
+
+        # Collusion with the right edge of the canvas.
+        if max_x >= self.__canvas_width:
+            self.__x_inc = False
+
+        if self.__x_inc == False:
+            self.__x_pos -= distance
+
+        # Collusion with the left edge of the canvas.
+        if min_x < 0:
+            self.__x_inc = True
+
+
+        if self.__y_inc:
+            self.__y_pos += distance
+
+        # Collusion with the bottom edge of the canvas.
+        if max_y >= self.__canvas_height:
+            self.__y_inc = False
+
+        if self.__y_inc == False:
+            self.__y_pos -= distance
+
+        # Collusion with the top edge of the canvas.
+        if min_y < 0:
+            self.__y_inc = True
+
+    def chameleon_mode(self):
+        """
+        This function is used to make the object change color over time, if
+        chameleon mode is selected. The colors are looked up from the
+        object's palette, so the color only moves to the next index.
+        :return: none
+        """
+
+        if self.__chameleon_mode_setting:
+            self.__color_index = (self.__color_index + 1) % CHAMELEON_PERIOD
+
+    def color(self):
+        # Returns the object's current RGB-color as a tuple.
+        return tuple(self.__palette_rgb[self.__color_index].tolist())
+
+    def gradient_bands(self):
+        """
+        Divides the edges of the current level of detail into GRADIENT_BANDS
+        bands by the y-coordinates of their midpoints. The bands are
+        calculated once per level of detail.
+        :return: The band of each detail edge as an int numpy array.
+        """
+
+        if self.__gradient_bands is None or \
+                self.__gradient_bands[0] is not self.__detail_edges:
+            y = self.__detail_vertexes[:, 1]
+            middles = y[self.__detail_edges].mean(axis=1) \
+                if len(self.__detail_edges) else np.zeros(0)
+            low = y.min() if len(y) else 0.0
+            height = (y.max() - low) if len(y) else 0.0
+
+            bands = np.zeros(len(middles), dtype=int) if height == 0 else \
+                ((middles - low) * (GRADIENT_BANDS / height)).astype(int)
+            np.clip(bands, 0, GRADIENT_BANDS - 1, out=bands)
+
+            self.__gradient_bands = (self.__detail_edges, bands)
+
+        return self.__gradient_bands[1]
+
+    def edge_depths(self, drawn, levels):
+        """
+        Divides the drawn edges into levels by the depths of their midpoints
+        relative to the object's center. The depths of all edges are
+        calculated at once.
+        :param numpy array drawn: A boolean array telling which of the detail
+               edges are drawn.
+        :param int levels: The number of levels.
+        :return: The level of each drawn edge as an int numpy array, level 0
+                 being the furthest away from the viewer.
+        """
+
+        edges = self.__detail_edges[drawn]
+
+        # Only the depths of the vertexes are needed, so one row of the
+        # rotation matrix is enough.
+        depth = self.__detail_vertexes @ \
+            (self.rotation_matrix()[2] * self.__size)
+        middles = depth[edges].mean(axis=1) if len(edges) else np.zeros(0)
+
+        reach = 2 * self.__mesh.radius() * abs(self.__size)
+        if reach == 0:
+            return np.full(len(edges), levels - 1, dtype=int)
+
+        depth_levels = ((middles / reach + 0.5) * levels).astype(int)
+        np.clip(depth_levels, 0, levels - 1, out=depth_levels)
+
+        return depth_levels
+
+    def edge_colors(self, drawn):
+        """
+        Finds the colors of the drawn edges. The colors are looked up from the
+        object's palette, so at most a few color strings are made per frame
+        no matter how many edges there are.
+        :param numpy array drawn: A boolean array telling which of the detail
+               edges are drawn.
+        :return: A tuple (bands, fills, rgb), where fills is a list of colors
+                 in hexadecimal, rgb contains the same colors as an int numpy
+                 array of shape (k, 3) and bands tells the index of each drawn
+                 edge's color in fills. If all edges have the same color,
+                 bands is None.
+        """
+
+        index = self.__color_index
+
+        if self.__color_mode == "gradient":
+            # The bands are spread over half of the chameleon cycle.
+            step = CHAMELEON_PERIOD // (2 * GRADIENT_BANDS)
+            indexes = (index + np.arange(GRADIENT_BANDS) * step) \
+                % CHAMELEON_PERIOD
+            fills = [self.__palette[i] for i in indexes.tolist()]
+
+            return self.gradient_bands()[drawn], fills, \
+                self.__palette_rgb[indexes]
+
+        if self.__color_mode == "depth":
+            brightness = np.linspace(DEPTH_MIN_BRIGHTNESS, 1, DEPTH_SHADES)
+            shades = (self.__palette_rgb[index]
+                      * brightness.reshape(-1, 1)).astype(int)
+            fills = [hex_color(rgb) for rgb in shades.tolist()]
+
+            return self.edge_depths(drawn, DEPTH_SHADES), fills, shades
+
+        return None, [self.__palette[index]], \
+            self.__palette_rgb[index:index + 1]
+
+    def edge_styles(self, drawn):
+        """
+        Finds the colors and widths of the drawn edges. The edges are grouped
+        into a small number of styles, so that the number of Tk calls needed
+        to style them doesn't depend on the number of edges. With depth
+        cueing every color is divided into DEPTH_CUE_LEVELS styles that get
+        darker and thinner further away from the viewer.
+        :param numpy array drawn: A boolean array telling which of the detail
+               edges are drawn.
+        :return: A tuple (bands, styles), where styles is a list of
+                 (fill, width) tuples and bands tells the index of each drawn
+                 edge's style in styles. If all edges have the same style,
+                 bands is None.
+        """
+
+        bands, fills, rgb = self.edge_colors(drawn)
+
+        if not self.__depth_cue:
+            return bands, [(fill, self.__thickness) for fill in fills]
+
+        # The level of every edge is found in one pass, and combined with
+        # the edge's color band so that the styles are ordered by color.
+        levels = self.edge_depths(drawn, DEPTH_CUE_LEVELS)
+        if bands is not None:
+            levels += bands * DEPTH_CUE_LEVELS
+
+        brightness = np.linspace(DEPTH_CUE_MIN_BRIGHTNESS, 1,
+                                 DEPTH_CUE_LEVELS)
+        widths = np.linspace(DEPTH_CUE_MIN_WIDTH, 1, DEPTH_CUE_LEVELS) \
+            * self.__thickness
+        widths = np.maximum(np.rint(widths), 1).astype(int).tolist()
+
+        shades = (rgb.reshape(-1, 1, 3)
+                  * brightness.reshape(1, -1, 1)).astype(int)
+        styles = [(hex_color(shade), widths[i % DEPTH_CUE_LEVELS])
+                  for i, shade in enumerate(shades.reshape(-1, 3).tolist())]
+
+        return levels, styles
+
+    def point_cells(self, projected):
+        """
+        Counts the projected vertexes in square cells of POINT_CLOUD_CELL
+        pixels on the canvas. The cells are shaded by the number of vertexes
+        in them on a logarithmic scale, in POINT_CLOUD_SHADES steps of the
+        object's current color.
+        :param numpy array projected: The object's projected vertexes returned
+               by project_vertexes.
+        :return: A tuple (corners, bands, styles), where corners contains the
+                 top left corners of the cells that have vertexes as an int
+                 numpy array of shape (k, 2), styles is a list of
+                 (fill, width) tuples and bands tells the index of each
+                 cell's style in styles.
+        """
+
+        cell = POINT_CLOUD_CELL
+        columns = int(self.__canvas_width) // cell + 1
+        rows = int(self.__canvas_height) // cell + 1
+
+        # Vertexes outside the canvas and outside the camera's depth range
+        # (NaN) aren't counted.
+        points = self.screen_points(projected)
+        inside = (points[:, 0] >= 0) & (points[:, 0] < columns * cell) \
+            & (points[:, 1] >= 0) & (points[:, 1] < rows * cell)
+        cells = points[inside].astype(np.int64) // cell
+
+        counts = np.bincount(cells[:, 1] * columns + cells[:, 0],
+                             minlength=rows * columns)
+        occupied = np.flatnonzero(counts)
+        counts = counts[occupied]
+
+        most = counts.max() if len(counts) else 1
+        if most > 1:
+            shades = np.log(counts) / np.log(most)
+        else:
+            shades = np.ones(len(counts))
+
+        bands = np.rint(shades * (POINT_CLOUD_SHADES - 1)).astype(int)
+
+        brightness = np.linspace(POINT_CLOUD_MIN_BRIGHTNESS, 1,
+                                 POINT_CLOUD_SHADES)
+        colors = (self.__palette_rgb[self.__color_index]
+                  * brightness.reshape(-1, 1)).astype(int)
+        styles = [(hex_color(rgb), cell) for rgb in colors.tolist()]
+
+        corners = np.stack([occupied % columns, occupied // columns],
+                           axis=1) * cell
+
+        return corners, bands, styles
+
+    def draw_points(self, canvas, projected):
+        """
+        Draws the object as a point cloud into given canvas at the object's
+        current position. Only the cells of the canvas that have vertexes are
+        drawn, so the number of drawn items doesn't depend on the number of
+        vertexes.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn on.
+        :param numpy array projected: The object's projected vertexes returned
+               by project_vertexes, or None if batch projection isn't used.
+        :return: none
+        """
+
+        # The vertexes are always projected at once in point cloud mode.
+        if projected is None:
+            projected = self.project_vertexes()
+
+        corners, bands, styles = self.point_cells(projected)
+        self.__drawn_edge_count = len(corners)
+
+        if isinstance(canvas, FrameBuffer):
+            for band, (fill, size) in enumerate(styles):
+                canvas.fill_squares(corners[bands == band], size, fill)
+            return
+
+        # On a canvas every cell is drawn as a line that is as wide as the
+        # cell, so the same line items can be used as for edges.
+        size = POINT_CLOUD_CELL
+        middles = corners[:, 1] + size // 2
+        segments = np.stack([corners[:, 0], middles, corners[:, 0] + size,
+                             middles], axis=1)
+
+        self.draw_canvas_lines(canvas, segments, bands, styles)
+
+    def update_line_items(self, canvas, segments, bands, styles):
+        """
+        Used in retained rendering to move the object's line items to the
+        lines drawn on this frame. Every style has its own list of items that
+        share a tag, so a style is changed with one call. Items are created
+        only when a style has more lines than ever before, and the items that
+        aren't needed are hidden instead of deleted.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn on.
+        :param numpy array segments: The lines as returned by edge_segments.
+        :param numpy array bands: The index of each line's style in styles, or
+               None if all lines have the first style.
+        :param list styles: The colors and widths of the lines as
+               (fill, width) tuples, as returned by edge_styles.
+        :return: none
+        """
+
+        # The items have to be created again if the canvas has changed or if
+        # they have been deleted from the canvas.
+        if canvas is not self.__line_canvas or \
+                any(items and canvas.type(items[0]) is None
+                    for items in self.__band_items):
+            canvas.delete(self.__tag)
+            self.__band_items = []
+            self.__band_shown = []
+            self.__band_styles = []
+            self.__line_canvas = canvas
+
+        # The lines are grouped by their colors.
+        if bands is None:
+            groups = [segments.tolist()]
+        else:
+            order = np.argsort(bands, kind="stable")
+            ends = np.cumsum(np.bincount(bands, minlength=len(styles)))
+            groups = [group.tolist()
+                      for group in np.split(segments[order], ends[:-1])]
+
+        for band in range(max(len(styles), len(self.__band_items))):
+            lines = groups[band] if band < len(styles) else []
+
+            if band == len(self.__band_items):
+                self.__band_items.append([])
+                self.__band_shown.append(0)
+                self.__band_styles.append(styles[band])
+
+            items = self.__band_items[band]
+            shown = self.__band_shown[band]
+            tag = "%s_%d" % (self.__tag, band)
+
+            # Styles without any items don't need to be configured.
+            if band < len(styles) and styles[band] != self.__band_styles[band]:
+                if items:
+                    fill, width = styles[band]
+                    canvas.itemconfig(tag, fill=fill, width=width)
+                self.__band_styles[band] = styles[band]
+
+            # Only the items whose visibility changes are configured.
+            for item in items[len(lines):shown]:
+                canvas.itemconfig(item, state="hidden")
+            for item in items[shown:len(lines)]:
+                canvas.itemconfig(item, state="normal")
+
+            while len(items) < len(lines):
+                fill, width = self.__band_styles[band]
+                items.append(canvas.create_line(0, 0, 0, 0, fill=fill,
+                                                width=width,
+                                                tags=(self.__tag, tag)))
+
+            # The coordinates of both ends of every line (x1, y1, x2, y2) are
+            # converted to Python numbers only for Tk.
+            for item, line in zip(items, lines):
+                canvas.coords(item, *line)
+
+            self.__band_shown[band] = len(lines)
+
+    def draw(self, canvas, steps=1, projected=None, profiler=None):
+        """
+        Draws the object into given canvas.
+        :param tkinter Canvas widget canvas: The canvas that the object will be
+               drawn on. This is also used to get the canvas' width and height
+               in case it has changed from the original size.
+        :param float steps: The number of animation steps the object's
+               rotation and movement are advanced by after this frame.
+        :param numpy array projected: The object's vertexes already projected
+               for this frame, like project_vertexes returns them. Used by
+               Scene, that projects all of its objects at once.
+        :param FrameProfiler profiler: If given, the time used by each stage
+               of drawing is recorded into it.
+        :return: none
+        """
+
+        profile = profiler.stage if profiler is not None else no_profiling
+
+        # Update the current canvas size.
+        self.__canvas_width = canvas.winfo_width()
+        self.__canvas_height = canvas.winfo_height()
+
+        self.__projection_count = 0
+
+        # Scene chooses the level of detail before it projects the objects.
+        if projected is None:
+            self.select_detail()
+
+        # With batch projection, all vertexes are projected once per frame.
+        # The same buffer is used for the maximum coordinates and the edges.
+        if projected is not None:
+            self.__projection_count += len(projected)
+        elif batch_projection:
+            with profile("proj"):
+                projected = self.project_vertexes()
+
+        # Get the current maximum coordinates of the object and move the object
+        # accordingly.
+        with profile("max_cordinates"):
+            max_x, min_x, max_y, min_y = self.max_cordinates(projected)
+
+        if self.__velocity == 0:
+            # Set the object to the center of the canvas, this is done to keep
+            # the object at the center even if the window size is modified.
+            # Objects placed with set_position keep their offset from it.
+            self.__x_pos = self.__canvas_width/2 + self.__x_offset
+            self.__y_pos = self.__canvas_height/2 + self.__y_offset
+
+        else:
+            self.move_object(max_x, min_x, max_y, min_y, steps)
+
+        # Change the object color if necessary.
+        with profile("chameleon_mode"):
+            self.chameleon_mode()
+
+        with profile("create_line"):
+            if self.__point_cloud:
+                self.draw_points(canvas, projected)
+            else:
+                self.draw_edges(canvas, projected)
+
+        self.__drawn_state = self.render_state(canvas)
+
+        # After each of the object's lines have been drawn, increases the
+        # rotation degrees if needed.
+        self.point_rotation(steps)
+
+    def edge_segments(self, projected, drawn):
+        """
+        Finds the lines the object's edges are drawn with on the canvas.
+        Edges that cross the camera's near or far plane are clipped to it and
+        edges that are completely outside the camera's depth range are left
+        out. If frustum culling is used, edges that are completely on one
+        side outside the canvas are also left out.
+        :param numpy array projected: The object's projected vertexes returned
+               by project_vertexes.
+        :param numpy array drawn: A boolean array telling which of the detail
+               edges are to be drawn.
+        :return: A tuple (segments, drawn), where segments is an int numpy
+                 array of shape (k, 4) containing the lines' ends
+                 (x1, y1, x2, y2) and drawn tells which edges the lines
+                 belong to.
+        """
+
+        edges = self.__detail_edges
+        points = self.screen_points(projected)
+
+        indexes = np.flatnonzero(drawn)
+        segments = points[edges[indexes]].reshape(-1, 4)
+
+        # Edges with an end outside the depth range are clipped before the
+        # projection, so their vertexes are rotated again.
+        crossing = np.flatnonzero(np.isnan(segments).any(axis=1))
+
+        if len(crossing):
+            crossing_edges = edges[indexes[crossing]]
+            inside, starts, ends = self.camera().clip_segments(
+                self.camera_points(self.__detail_vertexes[crossing_edges[:, 0]]),
+                self.camera_points(self.__detail_vertexes[crossing_edges[:, 1]]))
+
+            position = (self.__x_pos, self.__y_pos)
+            segments[crossing[inside]] = np.concatenate(
+                [np.trunc(starts + position), np.trunc(ends + position)],
+                axis=1)
+
+            keep = np.ones(len(segments), dtype=bool)
+            keep[crossing[~inside]] = False
+            segments = segments[keep]
+            indexes = indexes[keep]
+
+        if frustum_culling:
+            # Lines are left out if both of their ends are on the same side
+            # outside the canvas. The thickness of the lines is allowed for.
+            margin = self.__thickness
+            x = segments[:, 0::2]
+            y = segments[:, 1::2]
+
+            outside = (x < -margin).all(axis=1) \
+                | (x > self.__canvas_width + margin).all(axis=1) \
+                | (y < -margin).all(axis=1) \
+                | (y > self.__canvas_height + margin).all(axis=1)
+
+            segments = segments[~outside]
+            indexes = indexes[~outside]
+
+        drawn = np.zeros(len(edges), dtype=bool)
+        drawn[indexes] = True
+
+        return segments.astype(int), drawn
+
+    def draw_edges(self, canvas, projected):
+        """
+        Draws the object's edges into given canvas at the object's current
+        position.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn on.
+        :param numpy array projected: The object's projected vertexes returned
+               by project_vertexes, or None if batch projection isn't used.
+        :return: none
+        """
+
+        # Frame buffers are drawn on from scratch on every frame, so they don't
+        # use retained rendering.
+        headless = isinstance(canvas, FrameBuffer)
+
+        edges = self.__detail_edges
+
+        # With back-face culling only the visible edges are drawn.
+        drawn = self.visible_edges(projected)
+        if drawn is None:
+            drawn = np.ones(len(edges), dtype=bool)
+
+        if batch_projection:
+            # The edges only look up the already projected points, that are
+            # moved to the object's new position.
+            segments, drawn = self.edge_segments(projected, drawn)
+
+        else:
+            # Every edge's vertexes are projected into 2-dimensional space
+            # separately to get the actual coordinates for each line. Edges
+            # with a vertex outside the camera's depth range aren't drawn.
+            vertexes = self.__detail_vertexes
+            segments = []
+
+            for i in np.flatnonzero(drawn).tolist():
+                start = self.proj(vertexes[edges[i, 0]])
+                end = self.proj(vertexes[edges[i, 1]])
+
+                if start is None or end is None:
+                    drawn[i] = False
+                else:
+                    segments.append(start + end)
+
+            segments = np.array(segments, dtype=int).reshape(-1, 4)
+
+        self.__drawn_edge_count = len(segments)
+
+        # The styles are chosen once per object, not once per edge.
+        bands, styles = self.edge_styles(drawn)
+
+        if headless:
+            # A frame buffer can rasterize all edges of a style at once.
+            if bands is None:
+                canvas.draw_segments(segments, *styles[0])
+            else:
+                for band, (fill, width) in enumerate(styles):
+                    canvas.draw_segments(segments[bands == band], fill, width)
+            return
+
+        self.draw_canvas_lines(canvas, segments, bands, styles)
+
+    def draw_canvas_lines(self, canvas, segments, bands, styles):
+        """
+        Draws lines on a Tk canvas, either by moving the object's existing
+        line items or by creating new ones.
+        :param tkinter Canvas widget canvas: The canvas the object is drawn on.
+        :param numpy array segments: The ends of the lines (x1, y1, x2, y2)
+               as an int numpy array of shape (k, 4).
+        :param numpy array bands: The index of each line's style in styles, or
+               None if all lines have the first style.
+        :param list styles: The colors and widths of the lines as
+               (fill, width) tuples.
+        :return: none
+        """
+
+        if retained_rendering:
+            # In retained rendering the existing lines are only moved to
+            # their new places.
+            self.update_line_items(canvas, segments, bands, styles)
+            return
+
+        # The coordinates of both ends of every line (x1, y1, x2, y2) are
+        # converted to Python numbers only for Tk.
+        if bands is None:
+            fill, width = styles[0]
+            for segment in segments.tolist():
+                canvas.create_line(*segment, fill=fill, width=width)
+        else:
+            for segment, band in zip(segments.tolist(), bands.tolist()):
+                fill, width = styles[band]
+                canvas.create_line(*segment, fill=fill, width=width)
+
+
+class Scene:
+    # This class is used to draw many objects on the same canvas. Every frame
+    # the objects are projected first, one object at a time, after that each
+    # object moves and draws itself with its own projected vertexes.
+
+    def __init__(self, objects=()):
+        """
+        :param list objects: The objects in the scene.
+
+        Additionally the scene keeps a buffer for every object:
+
+        :param list rotated: The rotated vertexes of each object in the latest
+               frame as numpy arrays of shape (n, 3), or None before the
+               object's first frame. The arrays are reused between frames.
+        """
+
+        self.__objects = list(objects)
+        self.__rotated = [None] * len(self.__objects)
+
+    def add(self, object):
+        # Adds an object to the scene.
+        self.__objects.append(object)
+        self.__rotated.append(None)
+
+    def objects(self):
+        # Returns the objects in the scene as a list.
+        return self.__objects
+
+    def needs_redraw(self, canvas):
+        # Returns True if any of the objects needs to be drawn again, see
+        # Object.needs_redraw.
+        return any(object.needs_redraw(canvas) for object in self.__objects)
+
+    def project_vertexes(self):
+        """
+        Rotates and projects the vertexes of all objects. Each object's
+        current level of detail is rotated with its own rotation matrix into
+        a buffer that is kept for the object between frames, and projected
+        with its own size and camera. Objects that have a ParallelProjector
+        are projected with it instead.
+        :return: A list containing each object's projected vertexes relative
+                 to its center, like Object.project_vertexes returns them.
+        """
+
+        all_projected = []
+
+        for index, object in enumerate(self.__objects):
+            vertexes = object.select_detail()
+            projector = object.parallel_projector()
+
+            if projector is not None:
+                all_projected.append(projector.project(
+                    object.rotation_matrix(), object.size(), object.camera()))
+                continue
+
+            rotated = self.__rotated[index]
+            if rotated is None or rotated.shape != vertexes.shape:
+                rotated = np.empty(vertexes.shape)
+                self.__rotated[index] = rotated
+
+            # The rotation matrix comes from the object's TransformCache.
+            np.matmul(vertexes, object.rotation_matrix().T * object.size(),
+                      out=rotated)
+            all_projected.append(object.camera().project(rotated))
+
+        return all_projected
+
+    def draw(self, canvas, steps=1, profiler=None):
+        """
+        Draws all objects in the scene into given canvas.
+        :param tkinter Canvas widget canvas: The canvas the objects are drawn
+               on.
+        :param float steps: The number of animation steps the objects are
+               advanced by after this frame.
+        :param FrameProfiler profiler: If given, the time used by each stage
+               of drawing is recorded into it.
+        :return: none
+        """
+
+        if not self.__objects:
+            return
+
+        if not batch_projection:
+            for object in self.__objects:
+                object.draw(canvas, steps, profiler=profiler)
+            return
+
+        profile = profiler.stage if profiler is not None else no_profiling
+
+        with profile("proj"):
+            all_projected = self.project_vertexes()
+
+        for object, projected in zip(self.__objects, all_projected):
+            object.draw(canvas, steps, projected, profiler)
+
+
+def no_profiling(stage):
+    # Used instead of FrameProfiler.stage when nothing is profiled.
+    return contextlib.nullcontext()
+
+
+class FrameProfiler:
+    # This class collects the time used by each stage of drawing a frame. The
+    # timings of the latest frames are kept in a ring buffer, that can be
+    # shown as statistics or saved into a CSV-file.
+
+    def __init__(self, capacity=None):
+        """
+        :param int capacity: The number of latest frames kept. Defaults to
+               PROFILER_FRAMES.
+
+        Additionally these parameters are used to collect the timings:
+
+        :param deque frames: The latest frames as tuples (start, duration,
+               stages), where start is seconds since the profiler was created,
+               duration is the frame's length in seconds and stages is a
+               dictionary of stage name: seconds.
+        :param dict stages: The stage timings of the current frame.
+        :param float frame_start: The time the current frame started, or None
+               if no frame has been started.
+        """
+
+        if capacity is None:
+            capacity = PROFILER_FRAMES
+
+        self.__frames = collections.deque(maxlen=capacity)
+        self.__stages = {}
+        self.__frame_start = None
+        self.__created = time.perf_counter()
+
+    def start_frame(self):
+        # Starts timing a new frame.
+        self.__stages = {}
+        self.__frame_start = time.perf_counter()
+
+    def end_frame(self):
+        # Ends the current frame and stores its timings.
+        if self.__frame_start is None:
+            return
+
+        duration = time.perf_counter() - self.__frame_start
+        self.__frames.append((self.__frame_start - self.__created, duration,
+                              self.__stages))
+        self.__frame_start = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Measures the time of a stage, used as a with-statement:
+
+            with profiler.stage("proj"):
+                ...
+
+        If a stage is measured more than once during a frame, the times are
+        added together.
+        :param str name: The name of the stage.
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__stages[name] = self.__stages.get(name, 0) \
+                + time.perf_counter() - start
+
+    def frames(self):
+        # Returns the stored frames as a list, oldest first.
+        return list(self.__frames)
+
+    def stage_names(self):
+        # Returns the names of all stages in the stored frames in the order
+        # they were first measured.
+        names = {}
+        for start, duration, stages in self.__frames:
+            names.update(dict.fromkeys(stages))
+
+        return list(names)
+
+    def statistics(self, frame_count=60):
+        """
+        Calculates statistics of the latest frames.
+        :param int frame_count: The number of latest frames used.
+        :return: A dictionary with the frame rate, the mean frame time in
+                 milliseconds and the mean time of each stage in milliseconds,
+                 or None if there aren't enough frames yet.
+        """
+
+        frames = list(self.__frames)[-frame_count:]
+        if len(frames) < 2:
+            return None
+
+        elapsed = frames[-1][0] - frames[0][0]
+        stage_times = {}
+
+        for start, duration, stages in frames:
+            for name, seconds in stages.items():
+                stage_times[name] = stage_times.get(name, 0) + seconds
+
+        return {
+            "fps": (len(frames) - 1) / elapsed if elapsed > 0 else 0,
+            "frame_ms": sum(frame[1] for frame in frames) / len(frames) * 1000,
+            "stages_ms": {name: seconds / len(frames) * 1000
+                          for name, seconds in stage_times.items()}
+        }
+
+    def write_csv(self, path):
+        """
+        Saves the stored frames into a CSV-file. Every row is one frame with
+        its start time, duration and the time of each stage in milliseconds.
+        :param str path: Path of the file.
+        :return: none
+        """
+
+        names = self.stage_names()
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "start_s", "frame_ms"]
+                            + [name + "_ms" for name in names])
+
+            for i, (start, duration, stages) in enumerate(self.__frames):
+                writer.writerow(["%d" % i, "%.6f" % start,
+                                 "%.4f" % (duration * 1000)]
+                                + ["%.4f" % (stages.get(name, 0) * 1000)
+                                   for name in names])
+
+
+def clip_lines(starts, ends, width, height):
+    """
+    Clips lines to a rectangle from (0, 0) to (width - 1, height - 1) with the
+    Liang-Barsky algorithm. All lines are handled at once.
+    :param numpy array starts: Starting points of the lines, shape (n, 2).
+    :param numpy array ends: Ending points of the lines, shape (n, 2).
+    :param int width: Width of the rectangle.
+    :param int height: Height of the rectangle.
+    :return: The clipped starting and ending points of the lines that are at
+             least partly inside the rectangle.
+    """
+
+    starts = starts.astype(float)
+    ends = ends.astype(float)
+    delta = ends - starts
+
+    t0 = np.zeros(len(starts))
+    t1 = np.ones(len(starts))
+    keep = np.ones(len(starts), dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in ((-delta[:, 0], starts[:, 0]),
+                     (delta[:, 0], width - 1 - starts[:, 0]),
+                     (-delta[:, 1], starts[:, 1]),
+                     (delta[:, 1], height - 1 - starts[:, 1])):
+
+            # Lines parallel to the edge in question are outside of the
+            # rectangle if they are on the wrong side of it.
+            keep &= (p != 0) | (q >= 0)
+
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+
+    keep &= t0 <= t1
+
+    clipped_starts = starts[keep] + delta[keep] * t0[keep, np.newaxis]
+    clipped_ends = starts[keep] + delta[keep] * t1[keep, np.newaxis]
+
+    return clipped_starts, clipped_ends
+
+
+def rasterize_lines(starts, ends, width, height, thickness=1):
+    """
+    Calculates the pixels that lines between given points cover. All lines
+    are rasterized at once by sampling each line once per pixel along its
+    longer axis, which gives the same pixels as Bresenham's algorithm.
+    :param numpy array starts: Starting points of the lines, shape (n, 2).
+    :param numpy array ends: Ending points of the lines, shape (n, 2).
+    :param int width: Width of the image the lines are drawn on.
+    :param int height: Height of the image the lines are drawn on.
+    :param int thickness: The thickness of the lines in pixels.
+    :return: The x- and y-coordinates of the covered pixels as two int numpy
+             arrays.
+    """
+
+    starts, ends = clip_lines(starts, ends, width, height)
+
+    delta = ends - starts
+    steps = np.ceil(np.abs(delta).max(axis=1)).astype(np.int64)
+    counts = steps + 1
+
+    # Every pixel sample knows the line it belongs to and its position on
+    # that line.
+    line = np.repeat(np.arange(len(counts)), counts)
+    first_sample = np.repeat(np.cumsum(counts) - counts, counts)
+    position = (np.arange(counts.sum()) - first_sample) \
+        / np.maximum(steps, 1)[line]
+
+    xs = np.rint(starts[line, 0] + delta[line, 0] * position).astype(np.int64)
+    ys = np.rint(starts[line, 1] + delta[line, 1] * position).astype(np.int64)
+
+    if thickness > 1:
+        # Thick lines are drawn by stamping a square of the line's thickness
+        # on every pixel.
+        offsets = np.arange(thickness) - thickness // 2
+        xs = (xs[:, np.newaxis, np.newaxis]
+              + offsets[np.newaxis, np.newaxis, :]).repeat(thickness, axis=1)
+        ys = (ys[:, np.newaxis, np.newaxis]
+              + offsets[np.newaxis, :, np.newaxis]).repeat(thickness, axis=2)
+        xs = xs.ravel()
+        ys = ys.ravel()
+
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs = xs[inside]
+        ys = ys[inside]
+
+    return xs, ys
+
+
+def ppm_bytes(pixels):
+    """
+    Encodes an RGB image as a binary PPM-image. The encoding is only a header
+    followed by the pixels, so it is fast enough to be done every frame.
+    :param numpy array pixels: The image as an uint8 array of shape
+           (height, width, 3).
+    :return: bytes, the PPM-image.
+    """
+
+    height, width = pixels.shape[:2]
+
+    return b"P6 %d %d 255\n" % (width, height) + pixels.tobytes()
+
+
+def write_ppm(path, pixels):
+    """
+    Writes an RGB image into a binary PPM-file.
+    :param str path: Path of the file.
+    :param numpy array pixels: The image as an uint8 array of shape
+           (height, width, 3).
+    :return: none
+    """
+
+    with open(path, "wb") as file:
+        file.write(ppm_bytes(pixels))
+
+
+def write_png(path, pixels):
+    """
+    Writes an RGB image into a PNG-file.
+    :param str path: Path of the file.
+    :param numpy array pixels: The image as an uint8 array of shape
+           (height, width, 3).
+    :return: none
+    """
+
+    height, width = pixels.shape[:2]
+
+    def chunk(chunk_type, data):
+        return struct.pack(">I", len(data)) + chunk_type + data \
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+    # Every row of the image starts with filter type 0 (no filtering).
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2,
+                                              0, 0, 0)))
+        file.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        file.write(chunk(b"IEND", b""))
+
+
+class FrameBuffer:
+    # This class is an in-memory RGB image that objects can be drawn on
+    # instead of a canvas. It has the same width and height methods as a
+    # canvas, so Object.draw can use it without a display.
+
+    def __init__(self, width, height, background=(0, 0, 0)):
+        """
+        :param int width: The width of the image in pixels.
+        :param int height: The height of the image in pixels.
+        :param tuple background: The RGB-color of the background as a
+               (R, G, B) tuple.
+        """
+
+        self.__width = width
+        self.__height = height
+        self.__background = background
+        self.__pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        self.clear()
+
+    def winfo_width(self):
+        return self.__width
+
+    def winfo_height(self):
+        return self.__height
+
+    def pixels(self):
+        # Returns the image as an uint8 numpy array of shape
+        # (height, width, 3).
+        return self.__pixels
+
+    def clear(self):
+        # Fills the whole image with the background color.
+        self.__pixels[:] = self.__background
+
+    def resize(self, width, height):
+        """
+        Changes the size of the image. The image is cleared if its size
+        changes, otherwise the pixels are kept.
+        :param int width: The new width of the image in pixels.
+        :param int height: The new height of the image in pixels.
+        :return: none
+        """
+
+        if (width, height) == (self.__width, self.__height):
+            return
+
+        self.__width = width
+        self.__height = height
+        self.__pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        self.clear()
+
+    def draw_segments(self, segments, fill, width=1):
+        """
+        Draws all given lines at once.
+        :param numpy array segments: The ends of the lines (x1, y1, x2, y2),
+               shape (m, 4).
+        :param str fill: The color of the lines in hexadecimal, "#rrggbb".
+        :param int width: The thickness of the lines.
+        :return: none
+        """
+
+        if len(segments) == 0:
+            return
+
+        xs, ys = rasterize_lines(segments[:, :2], segments[:, 2:],
+                                 self.__width, self.__height, width)
+
+        self.__pixels[ys, xs] = tuple(bytes.fromhex(fill[1:]))
+
+    def fill_squares(self, corners, size, fill):
+        """
+        Fills squares of the same size at once.
+        :param numpy array corners: The top left corners of the squares
+               (x, y), shape (m, 2).
+        :param int size: The width and height of the squares in pixels.
+        :param str fill: The color of the squares in hexadecimal, "#rrggbb".
+        :return: none
+        """
+
+        if len(corners) == 0:
+            return
+
+        offsets = np.arange(size)
+        xs = (corners[:, 0].reshape(-1, 1, 1)
+              + offsets.reshape(1, 1, -1)).repeat(size, axis=1).ravel()
+        ys = (corners[:, 1].reshape(-1, 1, 1)
+              + offsets.reshape(1, -1, 1)).repeat(size, axis=2).ravel()
+
+        inside = (xs >= 0) & (xs < self.__width) & (ys >= 0) \
+            & (ys < self.__height)
+
+        self.__pixels[ys[inside], xs[inside]] = tuple(bytes.fromhex(fill[1:]))
+
+    def save(self, path):
+        """
+        Saves the image into a file. The file format is chosen by the file
+        extension, ".ppm" files are saved as PPM and all others as PNG.
+        :param str path: Path of the file.
+        :return: none
+        """
+
+        if path.lower().endswith(".ppm"):
+            write_ppm(path, self.__pixels)
+        else:
+            write_png(path, self.__pixels)
+
+
+def render_frames(object, frame_count, width, height, output_directory=None,
+                  image_format="png"):
+    """
+    Renders the object's animation without a display. Each frame is drawn on
+    a FrameBuffer and optionally saved into a file.
+    :param Object object: The object to be rendered.
+    :param int frame_count: The number of frames to be rendered.
+    :param int width: The width of the frames in pixels.
+    :param int height: The height of the frames in pixels.
+    :param str output_directory: If given, frames are saved into this
+           directory as frame_00000.png, frame_00001.png and so on.
+    :param str image_format: "png" or "ppm".
+    :return: A dictionary with the number of frames, the time used for
+             drawing them in seconds and the resulting frames per second.
+             Saving the frames isn't included in the time.
+    """
+
+    frame_buffer = FrameBuffer(width, height)
+
+    if output_directory is not None:
+        os.makedirs(output_directory, exist_ok=True)
+
+    draw_time = 0
+
+    for frame in range(frame_count):
+        start = time.perf_counter()
+        frame_buffer.clear()
+        object.draw(frame_buffer)
+        draw_time += time.perf_counter() - start
+
+        if output_directory is not None:
+            frame_buffer.save(os.path.join(
+                output_directory, "frame_%05d.%s" % (frame, image_format)))
+
+    return {"frames": frame_count,
+            "seconds": draw_time,
+            "fps": frame_count / draw_time if draw_time > 0 else float("inf")}
+
+
+# Mesh files are read in chunks of this many bytes (text files) or records
+# (binary files), so that reading a large file needs a bounded amount of
+# memory in addition to the resulting arrays.
+MESH_CHUNK_SIZE = 1 << 23
+MESH_CHUNK_RECORDS = 1 << 20
+
+# Numbers and the separators of the values in the tuples read by
+# parse_tuples. TUPLE_PUNCTUATION turns the parentheses and commas of a tuple
+# list into whitespace, so that the values can be split apart.
+NUMBER_PATTERN = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+INTEGER_PATTERN = r"[-+]?\d+"
+VALUE_SEPARATOR_PATTERN = r"(?:\s*,\s*|\s+)"
+TUPLE_PUNCTUATION = str.maketrans("(),", "   ")
+
+# Texture and normal references of OBJ face-elements, like "/2/3" in "1/2/3".
+OBJ_REFERENCE = re.compile(r"/\S*")
+
+# Numpy types of PLY properties.
+PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8"
+}
+
+# Hexadecimal forms of all color-values, used to make the colors Tk takes in.
+HEX_BYTES = ["%02x" % value for value in range(256)]
+
+PHI = (1+sqrt(5))/2   # Golden ratio
+regular_dodecahedron_vertexes = (-1, 1, 1), (-1, -1, 1), (1, -1, 1), \
+                                (1, 1, 1), (-1, 1, -1), (-1, -1, -1), \
+                                (1, -1, -1), (1, 1, -1), (0, PHI, 1/PHI), \
+                                (0, -PHI, -1/PHI), (0, PHI, -1/PHI), \
+                                (0, -PHI, 1/PHI), (1/PHI, 0, PHI), \
+                                (-1/PHI, 0, -PHI), (-1/PHI, 0, PHI), \
+                                (1/PHI, 0, -PHI), (PHI, 1/PHI, 0), \
+                                (-PHI, -1/PHI, 0), (-PHI, 1/PHI, 0), \
+                                (PHI, -1/PHI, 0)
+
+# All edges of a regular dodecahedron have the same length, so the edges
+# connect the vertexes that are closest to each other. They have been found
+# with nearest_neighbor_edges and are listed here, so that they don't need to
+# be searched for every time the module is imported.
+regular_dodecahedron_edges = (0, 8), (0, 14), (0, 18), (1, 11), (1, 14), \
+                             (1, 17), (2, 11), (2, 12), (2, 19), (3, 8), \
+                             (3, 12), (3, 16), (4, 10), (4, 13), (4, 18), \
+                             (5, 9), (5, 13), (5, 17), (6, 9), (6, 15), \
+                             (6, 19), (7, 10), (7, 15), (7, 16), (8, 10), \
+                             (9, 11), (12, 14), (13, 15), (16, 19), (17, 18)
+
+cube_vertexes = (-1, 1, 1), (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, -1), \
+                (-1, -1, -1), (1, -1, -1), (1, 1, -1)
+
+cube_edges = (0, 1), (0, 3), (0, 4), (1, 2), (1, 5), (2, 3), (2, 6), (3, 7), \
+             (4, 5), (4, 7), (5, 6), (6, 7)
+
+tetrahedron_vertexes = (1, 1, 1), (1, -1, -1), (-1, 1, -1), (-1, -1, 1)
+
+tetrahedron_edges = (0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)
+
+# Vertexes and edges of the pre-defined objects by their shape names.
+PREDEFINED_SHAPES = {
+    "regular_dodecahedron": (regular_dodecahedron_vertexes,
+                             regular_dodecahedron_edges),
+    "cube": (cube_vertexes, cube_edges),
+    "tetrahedron": (tetrahedron_vertexes, tetrahedron_edges)
+}
+
+# The faces of the pre-defined shapes, used in back-face culling. The faces
+# are found by predefined_faces when they are first needed.
+PREDEFINED_FACES = {}
+
+# FrameProfiler keeps the timings of the latest PROFILER_FRAMES frames.
+PROFILER_FRAMES = 600
+
+# The combined rotation matrices of the latest ROTATION_CACHE_SIZE rotation
+# states are kept in rotation_cache. The rotation degrees are rounded to
+# ROTATION_CACHE_STEPS steps per full turn.
+ROTATION_CACHE_SIZE = 1024
+ROTATION_CACHE_STEPS = 1 << 16
+rotation_cache = TransformCache(ROTATION_CACHE_SIZE)
+
+# The derived data of the latest MESH_DATA_CACHE_SIZE meshes objects have
+# been made from are kept in mesh_data_cache and shared between the objects.
+MESH_DATA_CACHE_SIZE = 4
+mesh_data_cache = MeshDataCache(MESH_DATA_CACHE_SIZE)
+
+# Projects all vertexes of the object at once with numpy if set to True,
+# otherwise every point is projected separately with Object.proj.
+batch_projection = True
+
+# The extents of an object on the canvas are found by projecting the vertexes
+# that are furthest in BOUNDS_DIRECTIONS directions.
+BOUNDS_DIRECTIONS = 256
+
+# Objects that have at least LOD_MIN_EDGES edges are simplified, so that their
+# vertexes move at most LOD_ERROR_PIXELS pixels on the canvas and at most
+# LOD_MAX_EDGES edges are drawn. Setting LOD_ERROR_PIXELS to 0 disables the
+# simplification.
+LOD_ERROR_PIXELS = 2.0
+LOD_MIN_EDGES = 10000
+LOD_MAX_EDGES = 100000
+
+# The camera the objects are looked at with, unless an object has its own.
+# The camera is CAMERA_DISTANCE pixels from the object's center and draws
+# depths from CAMERA_NEAR to CAMERA_FAR. If frustum_culling is set to True,
+# the edges outside the canvas aren't drawn.
+CAMERA_DISTANCE = 1000
+CAMERA_NEAR = 1
+CAMERA_FAR = 100000
+default_camera = Camera()
+frustum_culling = True
+
+# Projects the vertexes of objects that have at least
+# PARALLEL_PROJECTION_MIN_VERTEXES vertexes with PROJECTION_WORKERS worker
+# processes if set to True. If PROJECTION_WORKERS is None, one worker per CPU
+# is used.
+parallel_projection = False
+PARALLEL_PROJECTION_MIN_VERTEXES = 1 << 20
+PROJECTION_WORKERS = None
+
+# Creates the object's lines only once and moves them on every frame if set to
+# True, otherwise all lines are deleted and drawn again on every frame.
+retained_rendering = True
+
+# The colors of chameleon mode repeat after CHAMELEON_PERIOD frames. In
+# "gradient" color mode the object's edges are divided into GRADIENT_BANDS
+# colors and in "depth" color mode into DEPTH_SHADES shades, the furthest
+# shade having DEPTH_MIN_BRIGHTNESS times the brightness of the nearest one.
+COLOR_MODES = ("solid", "gradient", "depth")
+CHAMELEON_PERIOD = 510
+GRADIENT_BANDS = 16
+DEPTH_SHADES = 8
+DEPTH_MIN_BRIGHTNESS = 0.25
+
+# With depth cueing the edges are divided by their depth into
+# DEPTH_CUE_LEVELS levels. The edges furthest away from the viewer have
+# DEPTH_CUE_MIN_BRIGHTNESS times the brightness and DEPTH_CUE_MIN_WIDTH times
+# the thickness of the nearest ones.
+DEPTH_CUE_LEVELS = 4
+DEPTH_CUE_MIN_BRIGHTNESS = 0.3
+DEPTH_CUE_MIN_WIDTH = 0.4
+
+# In point cloud mode the vertexes are counted in cells of POINT_CLOUD_CELL
+# pixels. The cells are drawn in POINT_CLOUD_SHADES shades, the cells with
+# the fewest vertexes having POINT_CLOUD_MIN_BRIGHTNESS times the brightness
+# of the fullest ones.
+POINT_CLOUD_CELL = 4
+POINT_CLOUD_SHADES = 8
+POINT_CLOUD_MIN_BRIGHTNESS = 0.3
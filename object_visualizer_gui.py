@@ -0,0 +1,1240 @@
+"""
+Jere Liimatainen
+3D_object_visualizer / 3-uloitteisten kappaleiden havainnollistaja
+
+The Tk interface of the 3D object visualizer. The objects are defined and
+drawn by object_visualizer.py, this module only contains the window, its
+settings widgets and the animation loop.
+"""
+
+from tkinter import *
+from tkinter import filedialog
+import tkinter.font
+import os
+import random
+import time
+import numpy as np
+import object_visualizer
+from object_visualizer import *
+
+
+class TextMetrics:
+    # This class measures text drawn with a font using the font's metrics,
+    # so that no widgets need to be created and laid out for measuring. The
+    # measured widths are cached, because the intro measures the same lines
+    # over and over again.
+
+    def __init__(self, font):
+        """
+        :param tkinter.font.Font font: The font the text is drawn with.
+
+        Additionally the measurements are kept:
+
+        :param int line_height: The height of a line of text in pixels.
+        :param int char_width: The width of a character in pixels, if the
+               font is monospaced, otherwise None.
+        :param dict widths: The measured widths in pixels by the measured
+               strings.
+        :param dict prefix_widths: The widths of all beginnings of a line by
+               the line, as returned by prefix_widths.
+        """
+
+        self.__font = font
+        self.__line_height = font.metrics("linespace")
+        self.__char_width = font.measure("0") if font.metrics("fixed") \
+            else None
+        self.__widths = {}
+        self.__prefix_widths = {}
+
+    def width(self, line):
+        # Returns the width of a line of text in pixels.
+        if line not in self.__widths:
+            self.__widths[line] = self.__font.measure(line)
+
+        return self.__widths[line]
+
+    def prefix_widths(self, line):
+        """
+        Measures the widths of all beginnings of a line, so that the width of
+        a partly revealed line is only looked up.
+        :param str line: A line of text.
+        :return: A list where item i is the width of line[:i] in pixels.
+        """
+
+        if line not in self.__prefix_widths:
+            if self.__char_width is not None:
+                # In a monospaced font the widths can be counted.
+                widths = [self.__char_width * i for i in range(len(line) + 1)]
+            else:
+                widths = [self.width(line[:i]) for i in range(len(line) + 1)]
+
+            self.__prefix_widths[line] = widths
+
+        return self.__prefix_widths[line]
+
+    def dimensions(self, string):
+        """
+        Measures the width and height of given string, that may have many
+        lines.
+        :param str string: String of character/characters to be measured.
+        :return: A tuple containing the width and height of the string in
+                 pixels (width, height)
+        """
+
+        lines = string.split("\n")
+
+        return max(self.width(line) for line in lines), \
+            self.__line_height * len(lines)
+
+
+class PhotoImageBuffer(FrameBuffer):
+    # This class draws the objects into an image shown on a canvas. The edges
+    # are rasterized into the FrameBuffer's pixels and the whole image is
+    # copied onto the canvas as one PhotoImage, so the canvas only has one
+    # item no matter how many edges are drawn.
+
+    def __init__(self, canvas, background=(0, 0, 0)):
+        """
+        :param Canvas canvas: The canvas the image is shown on.
+        :param tuple background: The RGB-color of the background as a
+               (R, G, B) tuple.
+
+        Additionally the shown image is kept:
+
+        :param PhotoImage image: The image on the canvas, None until the
+               first frame is shown.
+        :param int item: The canvas item showing the image.
+        """
+
+        # The canvas is needed already by clear in FrameBuffer's __init__.
+        self.__canvas = canvas
+        self.__image = None
+        self.__item = None
+        FrameBuffer.__init__(self, max(1, canvas.winfo_width()),
+                             max(1, canvas.winfo_height()), background)
+
+    def clear(self):
+        # Follows the size of the canvas and fills the whole image with the
+        # background color.
+        self.resize(max(1, self.__canvas.winfo_width()),
+                    max(1, self.__canvas.winfo_height()))
+        FrameBuffer.clear(self)
+
+    def show(self):
+        """
+        Copies the drawn image onto the canvas. The PhotoImage is only
+        created again if the size of the image changes.
+        :return: none
+        """
+
+        data = ppm_bytes(self.pixels())
+        width, height = self.winfo_width(), self.winfo_height()
+
+        if self.__image is None or (self.__image.width(),
+                                    self.__image.height()) != (width, height):
+            self.__image = PhotoImage(master=self.__canvas, width=width,
+                                      height=height)
+
+            if self.__item is not None:
+                self.__canvas.delete(self.__item)
+
+            self.__item = self.__canvas.create_image(0, 0, anchor=NW,
+                                                     image=self.__image)
+            self.__canvas.tag_lower(self.__item)
+
+        self.__image.configure(data=data, format="PPM")
+
+
+class Interface:
+    # This class is used to create the GUI of the program and to draw the
+    # object.
+
+    def __init__(self):
+        
+        # Root settings
+        # ====================================================================
+        
+        # Used to configure the starting size of the program, to check if user 
+        # wants to skip intro and to initialize settings canvas, wich will be
+        # used as a host to all of the program's widgets.
+
+        self.__root = Tk()
+        self.__root.title("Interface test")
+        self.__root.geometry("1152x864")
+        self.__root.configure()
+        self.__intro_font = "Consolas 10"
+        self.__text_metrics = None
+        self.__parse_error = None
+        self.__x_pressed = False
+        self.__mainloop_running = False
+        self.__scene = None
+        self.__image_buffer = None
+        self.__profiler = FrameProfiler()
+        self.__show_stats = show_stats
+        self.__mesh_cache = None
+        self.__frame_job = None
+        self.__previous_frame_time = 0
+        self.__next_frame_time = 0
+        self.__root.protocol("WM_DELETE_WINDOW", self.quit)
+
+        if not disable_intro:
+            self.welcome()
+
+        self.__root.bind("<Return>", self.start_object)
+        self.__root.bind("<F3>", self.toggle_stats)
+        self.__settings_canvas = Canvas(self.__root)
+        self.__settings_canvas.pack(side=LEFT, fill=BOTH)
+        # ====================================================================
+
+        # Shape settings
+        # ====================================================================
+
+        # These widgets are used to select the shape of the object, if user
+        # has selected custom object setting, will call functions to
+        # initialize custom shape options.
+
+        self.__object_shape_frame = LabelFrame(self.__settings_canvas,
+                                               text="Object type")
+        self.__object_shape_frame.pack(pady=5)
+        
+        self.__object_shape = StringVar(self.__object_shape_frame)
+        self.__shape_options = [
+            "Regular dodecahedron",
+            "Cube",
+            "Tetrahedron",
+            "Custom object",
+            "Mesh file"
+        ]
+        self.__object_shape.set(self.__shape_options[0])
+        self.__object_shape_widget = OptionMenu(self.__object_shape_frame,
+                                                self.__object_shape,
+                                                *self.__shape_options)
+        self.__object_shape_widget.pack(pady=5)
+
+        # Edges behind the object are hidden if the object's faces are known.
+        self.__hide_back_lines = BooleanVar(self.__object_shape_frame,
+                                            value=False)
+        self.__hide_back_lines_box = Checkbutton(self.__object_shape_frame,
+                                                 variable=self.__hide_back_lines,
+                                                 text="Hide back lines")
+        self.__hide_back_lines_box.pack(anchor=W, pady=2)
+
+        # Point clouds are drawn without edges.
+        self.__point_cloud = BooleanVar(self.__object_shape_frame,
+                                        value=False)
+        self.__point_cloud_box = Checkbutton(self.__object_shape_frame,
+                                             variable=self.__point_cloud,
+                                             text="Point cloud")
+        self.__point_cloud_box.pack(anchor=W, pady=2)
+        self.__object_shape.trace("w", callback=self.custom_shape_menu)
+        self.__object_shape.trace("w", callback=self.mesh_file_menu)
+        # ====================================================================
+
+        # Rotation settings
+        # ====================================================================
+
+        # These widgets are used to determinate the rotation of the object
+        # around its own center point.
+
+        self.__object_rotation_frame = LabelFrame(self.__settings_canvas,
+                                                  text="Rotation settings")
+        self.__object_rotation_frame.pack(pady=5)
+        self.__random_rotation = BooleanVar(self.__object_rotation_frame,
+                                            value=True)
+
+        self.__x_rotation_label = Label(self.__object_rotation_frame, text="X")
+        self.__x_rotation_label.grid(row=0, column=0)
+        self.__x_rotation_value = Scale(self.__object_rotation_frame,
+                                        from_=0, to=20, orient=VERTICAL)
+        self.__x_rotation_value.set(5)
+        self.__x_rotation_value.grid(row=1, column=0)
+
+        self.__y_rotation_label = Label(self.__object_rotation_frame, text="Y")
+        self.__y_rotation_label.grid(row=0, column=1)
+        self.__y_rotation_value = Scale(self.__object_rotation_frame, from_=0,
+                                        to=20, orient=VERTICAL)
+        self.__y_rotation_value.set(5)
+        self.__y_rotation_value.grid(row=1, column=1)
+
+        self.__z_rotation_label = Label(self.__object_rotation_frame, text="Z")
+        self.__z_rotation_label.grid(row=0, column=2)
+        self.__z_rotation_value = Scale(self.__object_rotation_frame, from_=0,
+                                        to=20, orient=VERTICAL)
+        self.__z_rotation_value.set(0)
+        self.__z_rotation_value.grid(row=1, column=2)
+        # ====================================================================
+
+        # Color settings
+        # ====================================================================
+
+        # These widgets are used to set the color of the object to a permanent
+        # color or alternating color if chameleon-mode is selected.
+
+        self.__color_picker_frame = LabelFrame(self.__settings_canvas,
+                                               text="Object color")
+        self.__color_picker_frame.pack(pady=5)
+        self.__random_color = BooleanVar(self.__color_picker_frame,
+                                         value=False)
+        self.__chameleon_mode = Checkbutton(self.__color_picker_frame,
+                                            variable=self.__random_color,
+                                            text="Chameleon mode")
+        self.__chameleon_mode.grid(row=2, column=0, columnspan=3)
+
+        self.__red_label = Label(self.__color_picker_frame, text="Red")
+        self.__red_label.grid(row=0, column=0)
+        self.__red_slider = Scale(self.__color_picker_frame, from_=0, to=255,
+                                  orient=VERTICAL)
+        self.__red_slider.set(0)
+        self.__red_slider.grid(row=1, column=0)
+
+        self.__green_label = Label(self.__color_picker_frame, text="Green")
+        self.__green_label.grid(row=0, column=1)
+        self.__green_slider = Scale(self.__color_picker_frame, from_=0, to=255,
+                                    orient=VERTICAL)
+        self.__green_slider.set(255)
+        self.__green_slider.grid(row=1, column=1)
+
+        self.__blue_label = Label(self.__color_picker_frame, text="Blue")
+        self.__blue_label.grid(row=0, column=2)
+        self.__blue_slider = Scale(self.__color_picker_frame, from_=0, to=255,
+                                   orient=VERTICAL)
+        self.__blue_slider.set(0)
+        self.__blue_slider.grid(row=1, column=2)
+
+        # The color mode tells how the color varies between the edges.
+        self.__color_mode = StringVar(self.__color_picker_frame)
+        self.__color_mode.set(COLOR_MODES[0])
+        self.__color_mode_widget = OptionMenu(self.__color_picker_frame,
+                                              self.__color_mode,
+                                              *COLOR_MODES)
+        self.__color_mode_widget.grid(row=3, column=0, columnspan=3)
+
+        # Edges further away are drawn darker and thinner with depth cueing.
+        self.__depth_cue = BooleanVar(self.__color_picker_frame, value=False)
+        self.__depth_cue_box = Checkbutton(self.__color_picker_frame,
+                                           variable=self.__depth_cue,
+                                           text="Depth cueing")
+        self.__depth_cue_box.grid(row=4, column=0, columnspan=3)
+
+        # The edges are drawn into one image instead of canvas lines.
+        self.__image_rendering = BooleanVar(self.__color_picker_frame,
+                                            value=image_rendering)
+        self.__image_rendering_box = Checkbutton(
+            self.__color_picker_frame, variable=self.__image_rendering,
+            text="Draw as image")
+        self.__image_rendering_box.grid(row=5, column=0, columnspan=3)
+        # ====================================================================
+
+        # Size settings
+        # ====================================================================
+
+        self.__object_size_frame = LabelFrame(self.__settings_canvas,
+                                              text="Object size")
+        self.__object_size_frame.pack(pady=5)
+        self.__object_size = Scale(self.__object_size_frame, from_=20, to=150,
+                                   orient=HORIZONTAL)
+        self.__object_size.set(100)
+        self.__object_size.pack()
+        # ====================================================================
+
+        # Thickness settings
+        # ====================================================================
+
+        self.__object_thickness_frame = LabelFrame(self.__settings_canvas,
+                                                   text="Object thickness")
+        self.__object_thickness_frame.pack(pady=5)
+        self.__object_thickness = Scale(self.__object_thickness_frame, from_=1,
+                                        to=10, orient=HORIZONTAL)
+        self.__object_thickness.set(3)
+        self.__object_thickness.pack()
+        # ====================================================================
+
+        # Velocity settings
+        # ====================================================================
+        self.__object_velocity_frame = LabelFrame(self.__settings_canvas,
+                                                  text="Object velocity")
+        self.__object_velocity_frame.pack(pady=5)
+        self.__object_velocity = Scale(self.__object_velocity_frame, from_=0,
+                                       to=3, resolution=.1, orient=HORIZONTAL)
+        self.__object_velocity.set(0)
+        self.__object_velocity.pack()
+        # ====================================================================
+
+        # Object count settings
+        # ====================================================================
+        self.__object_count_frame = LabelFrame(self.__settings_canvas,
+                                               text="Object count")
+        self.__object_count_frame.pack(pady=5)
+        self.__object_count = Scale(self.__object_count_frame, from_=1,
+                                    to=50, orient=HORIZONTAL)
+        self.__object_count.set(1)
+        self.__object_count.pack()
+        # ====================================================================
+
+        # Update-button and canvas
+        # ====================================================================
+
+        # Update button is used to update the object with the currently
+        # selected object settings. self.__canvas is used as a background to
+        # the object.
+
+        self.__update_button = Button(self.__settings_canvas,
+                                      text="Update\n<Enter>",
+                                      command=self.start_object)
+        self.__update_button.pack()
+        
+        self.__canvas = Canvas(self.__root, bg=BLACK)
+        self.__canvas.pack(side=LEFT, fill=BOTH, expand=1)
+
+        # A static object isn't drawn again until the canvas is resized.
+        self.__canvas.bind("<Configure>", self.wake_animation)
+        # ====================================================================
+
+        self.start_object()  # Start the object with default settings on start.
+
+        # Checks if user has clicked the "X"-button.
+        if self.crashed():
+            return
+
+        self.__mainloop_running = True
+        self.__root.mainloop()
+
+    def quit(self):
+        # Executed when the "X"-button is pressed.
+
+        print('User pressed "X", program terminating')
+        self.__x_pressed = True
+
+        if profile_csv_path is not None:
+            self.__profiler.write_csv(profile_csv_path)
+            print("Frame timings saved into", profile_csv_path)
+
+        # During the intro the window is closed after the intro has checked
+        # the flag, otherwise the main loop is stopped right away.
+        if self.__mainloop_running:
+            self.__root.destroy()
+
+    def crashed(self):
+        # Check's if the "X"-button is pressed.
+
+        if self.__x_pressed:
+            return True
+        else:
+            return
+
+    def stop_intro(self):
+        # Used to check if user pressed spacebar to skip the intro.
+        if self.__stop_intro_flag:
+            self.__canvas.destroy()
+            self.__root.unbind("<space>")
+            print("Intro skipped")
+
+            return True
+
+        else:
+            return False
+
+    def set_stop_intro(self, *args):
+        # Sets stop_intro_flag.
+        self.__stop_intro_flag = True
+
+    def welcome(self):
+        # This method is used to create the intro for this program. All above
+        # elements are purely for cosmetic purposes and do not affect the 
+        # program's functionality.
+
+        self.__canvas = Canvas(self.__root, bg=BLACK)
+        self.__canvas.pack(expand=True, fill=BOTH)
+        self.__canvas.update()
+
+        # If user presses space, the intro will be skipped.
+        self.__stop_intro_flag = False
+        self.__root.bind("<space>", self.set_stop_intro)
+
+        metrics = self.text_metrics()
+
+        # Actual width and height of a single char in pixels as a tuple.
+        char_dimensions = metrics.dimensions("|")
+        
+        # ASCII-art of the welcoming text.
+        WELCOME = \
+"     ____      ____  ________   _____        ______     ___     ____    ____   ________ \n\
+    |_  _|    |_  _||_   __  | |_   _|     .' ___  |  .'   `.  |_   \  /   _| |_   __  |\n\
+      \ \  /\  / /    | |_ \_|   | |      / .'   \_| /  .-.  \   |   \/   |     | |_ \_|\n\
+       \ \/  \/ /     |  _| _    | |   _  | |        | |   | |   | |\  /| |     |  _| _ \n\
+        \  /\  /     _| |__/ |  _| |__/ | \ `.___.'\ \  `-'  /  _| |_\/_| |_   _| |__/ |\n\
+         \/  \/     |________| |________|  `.____ .'  `.___.'  |_____||_____| |________|"
+
+
+        WELCOME_width, WELCOME_height = metrics.dimensions(WELCOME)
+        WELCOME_rows = WELCOME.split("\n")
+
+        # The row the cursor is on and the number of revealed chars on it.
+        row = 0
+        column = 0
+
+        CURSOR_COLOR = WHITE    # Set initial cursor color
+
+        # The speed of wich the WELCOME text is writen and deleted.
+        PRINT_SPEED = 0.005
+
+        # The items are created once, after that the text is only appended to
+        # and the items are moved, instead of drawing everything again on
+        # every tick.
+        text = self.__canvas.create_text(0, 0, fill=GREEN, anchor=NW, text="",
+                                         font=self.__intro_font)
+        cursor = self.__canvas.create_rectangle(0, 0, 0, 0, fill=CURSOR_COLOR)
+        skip_text = self.__canvas.create_text(0, 0, fill=GREY, anchor=N,
+                                              text="Press SPACE to skip intro",
+                                              font=self.__intro_font)
+
+        def place_items():
+            # Moves the items to the center of the window, in case its size
+            # has changed, and the cursor after the revealed chars.
+
+            # Starting point of WELCOME.
+            x = (self.__root.winfo_width() - WELCOME_width) // 2
+            y = (self.__root.winfo_height() - WELCOME_height) // 2
+
+            # Determinates the starting and ending point of the cursor.
+            x0 = x + metrics.prefix_widths(WELCOME_rows[row])[column]
+            x1 = x0 + char_dimensions[0]
+            y1 = y + char_dimensions[1] * (row + 1)
+            y0 = y1 - char_dimensions[1]
+
+            self.__canvas.coords(text, x, y)
+            self.__canvas.coords(cursor, x0, y0, x1, y1)
+            self.__canvas.coords(skip_text, self.__root.winfo_width() / 2,
+                                 self.__root.winfo_height() / 1.1)
+
+        # Makes the cursor blink at the start.
+        for n in range(5):
+
+            # Check's if space or "X" is pressed. Space skips the intro,
+            # "X" press shuts down the whole program.
+            if self.stop_intro() or self.crashed():
+                return
+
+            place_items()
+            self.__canvas.itemconfig(cursor, fill=CURSOR_COLOR)
+            self.update_all(clear=False)
+
+            # Cursor blinking.
+            if CURSOR_COLOR == WHITE:
+                CURSOR_COLOR = BLACK
+            else:
+                CURSOR_COLOR = WHITE
+
+            time.sleep(0.7)
+
+        self.__canvas.delete(skip_text)
+        self.__canvas.itemconfig(cursor, fill=WHITE)
+
+        # Prints WELCOME one letter at a time. The ticks are timed from the
+        # start, so the time used for drawing doesn't slow the printing.
+        next_tick = time.perf_counter()
+
+        for char in WELCOME:
+            if self.stop_intro() or self.crashed():
+                return
+
+            if char == "\n":
+                row += 1
+                column = 0
+            else:
+                column += 1
+
+            self.__canvas.insert(text, END, char)
+            place_items()
+            self.update_all(clear=False)
+
+            next_tick += PRINT_SPEED
+            time.sleep(max(0, next_tick - time.perf_counter()))
+
+        # Makes the cursor blink at the end of printing WELCOME.
+        for n in range(5):
+            if self.stop_intro() or self.crashed():
+                return
+
+            place_items()
+            self.__canvas.itemconfig(cursor, fill=CURSOR_COLOR)
+
+            # Cursor blinking.
+            if CURSOR_COLOR == WHITE:
+                CURSOR_COLOR = BLACK
+            else:
+                CURSOR_COLOR = WHITE
+
+            self.update_all(clear=False)
+            time.sleep(0.7)
+
+        self.__canvas.delete(cursor)
+
+        # Erases WELCOME-text two characters at a time, one from front one
+        # from the end of the text.
+        WELCOME_chars = list(WELCOME)
+        next_tick = time.perf_counter()
+
+        for i in range(len(WELCOME_chars) // 2):
+            if self.stop_intro() or self.crashed():
+                return
+
+            if WELCOME_chars[i] != "\n":
+                WELCOME_chars[i] = " "
+
+            if WELCOME_chars[-i] != "\n":
+                WELCOME_chars[-i] = " "
+
+            self.__canvas.itemconfig(text, text="".join(WELCOME_chars))
+            place_items()
+            self.update_all(clear=False)
+
+            next_tick += PRINT_SPEED
+            time.sleep(max(0, next_tick - time.perf_counter()))
+
+        self.__canvas.destroy()
+
+    def update_all(self, clear=True):
+        # Used to update root and canvas and clear canvas after updates, this
+        # is used to animate things on canvas. In retained rendering the
+        # canvas items are kept and clear is set to False. The time used by
+        # the updates is recorded into the profiler.
+        with self.__profiler.stage("canvas.update"):
+            self.__canvas.update()
+
+        with self.__profiler.stage("root.update"):
+            self.__root.update()
+
+        self.__canvas.pack(expand=True, fill=BOTH)
+
+        if clear:
+            self.__canvas.delete(ALL)
+
+    def toggle_stats(self, *args):
+        # Shows or hides the frame statistics overlay, bound to F3.
+        self.__show_stats = not self.__show_stats
+
+        if not self.__show_stats:
+            self.__canvas.delete("stats")
+
+        self.wake_animation()
+
+    def wake_animation(self, *args):
+        # Starts animating again after the animation has stopped because
+        # nothing on the canvas was changing.
+        if self.__frame_job is not None or self.__scene is None \
+                or self.crashed():
+            return
+
+        self.__previous_frame_time = time.perf_counter()
+        self.__next_frame_time = self.__previous_frame_time
+        self.__frame_job = self.__root.after_idle(self.animate)
+
+    def draw_stats(self):
+        # Draws the frame rate, frame time and the time of each drawing stage
+        # of the latest frames on the top left corner of the canvas.
+
+        statistics = self.__profiler.statistics()
+        if statistics is None:
+            return
+
+        lines = ["%.1f fps  %.2f ms/frame" % (statistics["fps"],
+                                             statistics["frame_ms"])]
+        for name, milliseconds in statistics["stages_ms"].items():
+            lines.append("%-15s %6.2f ms" % (name, milliseconds))
+
+        text = "\n".join(lines)
+
+        # The overlay is created again if the canvas has been cleared.
+        if not self.__canvas.find_withtag("stats"):
+            self.__canvas.create_text(10, 10, anchor=NW, fill=WHITE,
+                                      font=self.__intro_font, tags="stats")
+
+        self.__canvas.itemconfig("stats", text=text)
+        self.__canvas.tag_raise("stats")
+
+    def custom_shape_menu(self, *args):
+        # Used to construct a custom shape menu if selected at shape options,
+        # additionally if different stock shape is selected, will destroy the
+        # menu. Also if custom point connection is selected, will call
+        # custom point connection function.
+
+        try:
+            self.__custom_points.get()
+
+            if self.__object_shape.get() != "Custom object":
+                self.__custom_points.destroy()
+                self.__custom_points_label.destroy()
+                self.__connect_all_points_box.destroy()
+                self.__custom_connection_box.destroy()
+                self.__custom_point_connection_label.destroy()
+                self.__custom_point_connection.destroy()
+                self.__custom_faces_label.destroy()
+                self.__custom_faces.destroy()
+
+        except:
+            if self.__object_shape.get() == "Custom object":
+                self.__custom_points_label = Label(self.__object_shape_frame,
+                                                   text="Enter custom points as tuples:")
+                self.__custom_points_label.pack(anchor=W, pady=2)
+                self.__custom_points = Entry(self.__object_shape_frame)
+                self.__custom_points.insert(1, "")
+                self.__custom_points.pack(anchor=W, pady=2)
+                self.__custom_faces_label = Label(self.__object_shape_frame,
+                                                  text="Enter faces as tuples (optional):")
+                self.__custom_faces_label.pack(anchor=W, pady=2)
+                self.__custom_faces = Entry(self.__object_shape_frame)
+                self.__custom_faces.insert(1, "")
+                self.__custom_faces.pack(anchor=W, pady=2)
+                self.__point_connection_type = BooleanVar(self.__object_shape_frame,
+                                                    value=True)
+                self.__connect_all_points_box = Radiobutton(
+                                                self.__object_shape_frame,
+                                                text="Connect all points",
+                                                variable=self.__point_connection_type,
+                                                value=True)
+                self.__custom_connection_box = Radiobutton(
+                                               self.__object_shape_frame,
+                                               text="Custom point connection",
+                                               variable=self.__point_connection_type,
+                                               value=False)
+
+                self.__connect_all_points_box.pack(anchor=W, pady=2)
+                self.__custom_connection_box.pack(anchor=W, pady=2)
+                self.__point_connection_type.trace("w",
+                                                   callback=self.custom_point_connection_menu)
+
+    def custom_point_connection_menu(self, *args):
+        # This function is called to create custom point connection menu. If
+        # custom point connection is not selected, will destroy the menu.
+
+        point_connection_type = self.__point_connection_type.get()
+        try:
+            self.__custom_point_connection.get()
+            if point_connection_type == True:
+                self.__custom_point_connection_label.destroy()
+                self.__custom_point_connection.destroy()
+
+        except:
+            if point_connection_type == False:
+                self.__custom_point_connection_label = Label(self.__object_shape_frame,
+                                                             text="Enter custom points as tuples:")
+                self.__custom_point_connection_label.pack(anchor=W, pady=2)
+                self.__custom_point_connection = Entry(self.__object_shape_frame)
+                self.__custom_point_connection.insert(1, "")
+                self.__custom_point_connection.pack(anchor=W, pady=2)
+
+    def mesh_file_menu(self, *args):
+        # Used to construct a menu for choosing a mesh file if selected at
+        # shape options, additionally if different shape is selected, will
+        # destroy the menu.
+
+        try:
+            self.__mesh_file.get()
+
+            if self.__object_shape.get() != "Mesh file":
+                self.__mesh_file_label.destroy()
+                self.__mesh_file.destroy()
+                self.__mesh_file_button.destroy()
+
+        except:
+            if self.__object_shape.get() == "Mesh file":
+                self.__mesh_file_label = Label(self.__object_shape_frame,
+                                               text="OBJ, PLY or STL file:")
+                self.__mesh_file_label.pack(anchor=W, pady=2)
+                self.__mesh_file = Entry(self.__object_shape_frame)
+                self.__mesh_file.pack(anchor=W, pady=2)
+                self.__mesh_file_button = Button(self.__object_shape_frame,
+                                                 text="Browse...",
+                                                 command=self.browse_mesh_file)
+                self.__mesh_file_button.pack(anchor=W, pady=2)
+
+    def browse_mesh_file(self):
+        # Opens a file dialog for choosing the mesh file and puts the chosen
+        # path into the mesh file entry.
+
+        path = filedialog.askopenfilename(
+            filetypes=[("Mesh files", "*.obj *.ply *.stl"),
+                       ("All files", "*")])
+
+        if path:
+            self.__mesh_file.delete(0, END)
+            self.__mesh_file.insert(0, path)
+
+    def entryfield_error(self, entryfield, packtype, grid_row, grid_column,
+                         error=None):
+        """
+        Used to show error message on entry field for a brief period of time
+        when executed.
+        :param Entry-widget entry field: The entry filed that the error message
+               is going to be shown on.
+        :param str pack type: The managing type of the entry field.
+        :param int grid_row: The row of given grid.
+        :param int grid_column: The column of given grid.
+        :param ParseError error: If given, the error message is shown instead
+               of "Invalid input!" and the place of the error is selected
+               when the original text is put back.
+        :return: None
+        """
+
+        # Original entry is stored in variable so that it can be put back on
+        # the field after error message is shown.
+        original_entry = entryfield.get()
+
+        # Show error message on field.
+        entryfield.delete(0, END)
+        entryfield.insert(1, "Invalid input!" if error is None
+                          else "Invalid input: %s!" % error)
+        entryfield.configure(foreground=RED)
+
+        if packtype == "pack":
+            entryfield.pack(pady=5)
+        else:
+            entryfield.grid(row=grid_row, column=grid_column)
+
+        # Show changes and wait for a bit before restoring to original value.
+        self.__root.update()
+        time.sleep(0.5)
+
+        entryfield.delete(0, END)
+        entryfield.insert(1, original_entry)
+
+        if error is not None:
+            entryfield.focus_set()
+            entryfield.icursor(error.position)
+            entryfield.selection_range(error.position, error.position + 1)
+            entryfield.xview(max(error.position - 10, 0))
+
+        if packtype == "pack":
+            entryfield.pack(pady=5)
+        else:
+            entryfield.grid(row=grid_row, column=grid_column)
+
+    def text_metrics(self):
+        # Returns the TextMetrics of the intro font. The font is looked up
+        # only once.
+        if self.__text_metrics is None:
+            self.__text_metrics = TextMetrics(
+                tkinter.font.Font(root=self.__root, font=self.__intro_font))
+
+        return self.__text_metrics
+
+    # These next methods, "_get"-ending functions, are used to check user's
+    # set settings and return them. They are used to construct the object.
+
+    def custom_points_get(self, points_str):
+        """
+        Convert's given string of points into an array containing all
+        vertexes (x, y, z).
+        :param Entry-widget points_str: An entry field containing user's given
+               points as a string of text. The string should be formatted as:
+               "(x1,y1,z1), (x2,y2,z2)", the coordinates can be decimal
+               numbers, see parse_tuples.
+        :return: All given vertexes as a numpy array of shape (n, 3).
+        :raises ParseError: If the points aren't given correctly.
+        """
+
+        return parse_points(points_str.get())
+
+    def custom_point_connections_get(self, point_connections, object_points):
+        """
+        Used to check if user's given custom point connections are given
+        correctly, raises an error if not. A connection is represented as for
+        example: (0, 1), which means connect the first vertex to the second.
+        :param Entry-widget point_connections: The entry that contains the
+               connections as a list of tuples.
+        :param lst object_points: The vertexes of the object. This is used to
+               check that given connections aren't out of range.
+        :return: The connections between the object's vertexes as a numpy
+                 array of shape (m, 2).
+        :raises ParseError: If the connections aren't given correctly, a
+                connection is out of range, connects a vertex to itself or
+                is given twice.
+        """
+
+        return parse_edges(point_connections.get(), len(object_points))
+
+    def custom_faces_get(self, faces_str, object_points):
+        """
+        Used to check if user's given faces are given correctly, raises an
+        error if not. A face is represented as for example: (0,1,2,3), which
+        means that the first four vertexes are the corners of a face.
+        :param Entry-widget faces_str: The entry that contains the faces as a
+               list of tuples.
+        :param lst object_points: The vertexes of the object. This is used to
+               check that the corners aren't out of range.
+        :return: A list containing the faces as tuples.
+        :raises ParseError: If the faces aren't given correctly.
+        """
+
+        return parse_faces(faces_str.get(), len(object_points))
+
+    def selected_faces_get(self, object_points):
+        """
+        Used to get the faces of the selected shape for hiding the back
+        lines.
+        :param lst object_points: The vertexes of the selected shape.
+        :return: The faces, None if the faces of the shape aren't known or an
+                 error message.
+        """
+
+        shape_name = self.__object_shape.get().lower().replace(" ", "_")
+
+        if shape_name == "custom_object":
+            if self.__custom_faces.get().strip() == "":
+                return None
+
+            try:
+                return self.custom_faces_get(self.__custom_faces,
+                                             object_points)
+            except ParseError as error:
+                self.__parse_error = error
+                return "faces error"
+
+        return predefined_faces(shape_name)
+
+    def selected_shape_get(self):
+        """
+        Used to determinate what object-type has been selected. Only the
+        selected shape is constructed.
+        :return: The vertexes and edges of the selected shape as a tuple, or
+                 an error message.
+        """
+
+        # Formatting the shape name.
+        shape_name = self.__object_shape.get().lower()
+
+        if " " in shape_name:
+            shape_name = shape_name.replace(" ", "_")
+
+        if shape_name == "custom_object":   # User selected custom object.
+
+            # Checks what kind of connection is going to be used.
+            point_connection_type = self.__point_connection_type.get()
+
+            # Gets the custom points given by user and returns error if needed.
+            # The error is kept for showing where it is.
+            try:
+                object_points = self.custom_points_get(self.__custom_points)
+
+            except ParseError as error:
+                self.__parse_error = error
+                return "custom points error"
+
+            # There needs to be at least 2 point to draw an object.
+            if len(object_points) < 2:
+                self.__parse_error = ParseError("at least 2 points are needed",
+                                                len(self.__custom_points.get()))
+                return "custom points error"
+
+            if self.__point_cloud.get():
+                # A point cloud is drawn without edges, so no connections
+                # are made between the points.
+                object_edges = np.zeros((0, 2), dtype=np.int32)
+
+            elif point_connection_type:
+                # All possible connections between vertexes.
+                object_edges = point_connector(object_points)
+
+            else:   # User want's to use custom connections.
+                try:
+                    object_edges = self.custom_point_connections_get(
+                        self.__custom_point_connection, object_points)
+
+                except ParseError as error:
+                    self.__parse_error = error
+                    return "connecting points error"
+
+            # Finally, if no errors occurred, the object is made of given
+            # vertexes and edges.
+            return object_points, object_edges
+
+        elif shape_name == "mesh_file":
+            return self.mesh_get(self.__mesh_file.get())
+
+        # If user has selected pre-defined object.
+        return PREDEFINED_SHAPES[shape_name]
+
+    def mesh_get(self, path):
+        """
+        Reads the mesh from given file. The latest mesh is kept in memory, so
+        a large file isn't read again every time the object is updated.
+        :param str path: Path of the mesh file.
+        :return: The mesh's normalized vertexes and edges as numpy arrays or an
+                 error message. Meshes without edges are only accepted in
+                 point cloud mode, where the edges aren't drawn.
+        """
+
+        try:
+            modified = os.path.getmtime(path)
+
+            if self.__mesh_cache is None or \
+                    self.__mesh_cache[:2] != (path, modified):
+                vertexes, edges = load_mesh(path)
+                self.__mesh_cache = (path, modified,
+                                     normalize_vertexes(vertexes), edges)
+
+        except (OSError, ValueError) as error:
+            print(error)
+            return "mesh file error"
+
+        if len(self.__mesh_cache[2]) == 0:
+            return "mesh file error"
+
+        if len(self.__mesh_cache[3]) == 0 and not self.__point_cloud.get():
+            return "mesh file error"
+
+        return self.__mesh_cache[2:]
+
+    def color_get(self):
+        # Used to return user's color choice in RGB-tuple.
+
+        if self.__random_color.get() == False:
+            r = int(self.__red_slider.get())
+            g = int(self.__green_slider.get())
+            b = int(self.__blue_slider.get())
+
+        else:
+            r = random.randint(0, 255)
+            g = random.randint(0, 255)
+            b = random.randint(0, 255)
+
+        return (r, g, b)
+
+    def rotations_get(self):
+        # Used to return user's chosen rotation amounts. The actual amounts
+        # are converted into smaller values.
+
+        x_rotation = float(self.__x_rotation_value.get()) * 0.001
+        y_rotation = float(self.__y_rotation_value.get()) * 0.001
+        z_rotation = float(self.__z_rotation_value.get()) * 0.001
+
+        return x_rotation, y_rotation, z_rotation
+
+    def start_object(self, *args):
+        """
+        This method is used to construct the objects with user's configuration
+        and to animate the movement of the objects.
+        :return: None
+        """
+
+        shape = self.selected_shape_get()
+        
+        try:
+            if shape == "custom points error":
+                raise IndexError
+            
+            elif shape == "connecting points error":
+                raise ValueError
+
+            elif shape == "mesh file error":
+                raise OSError
+
+            if self.__object_shape.get() == "Mesh file":
+                self.__mesh_file.configure(foreground=BLACK)
+
+            # This makes sure that the entry fields containing custom point
+            # settings have black font on them when there is no error raised.
+            if self.__object_shape.get() == "Custom object":
+                self.__custom_points.configure(foreground=BLACK)
+
+                try:
+                    self.__custom_point_connection.configure(foreground=BLACK)
+                except:
+                    pass
+
+        # Using the entryfield_error method to show error message on the
+        # entry-widget.
+        except IndexError:
+            print("custom points error occured:", self.__parse_error)
+            self.entryfield_error(self.__custom_points, "pack", 0, 0,
+                                  self.__parse_error)
+                
+            return
+
+        except ValueError:
+            print("connecting points error occured:", self.__parse_error)
+            self.entryfield_error(self.__custom_point_connection, "pack", 0, 0,
+                                  self.__parse_error)
+            
+            return
+
+        except OSError:
+            print("mesh file error occured!")
+            self.entryfield_error(self.__mesh_file, "pack", 0, 0)
+
+            return
+
+        faces = self.selected_faces_get(shape[0])
+
+        if faces == "faces error":
+            print("faces error occured:", self.__parse_error)
+            self.entryfield_error(self.__custom_faces, "pack", 0, 0,
+                                  self.__parse_error)
+
+            return
+
+        if self.__object_shape.get() == "Custom object":
+            self.__custom_faces.configure(foreground=BLACK)
+
+        x_rotation, y_rotation, z_rotation = self.rotations_get()
+        canvas_width = self.__canvas.winfo_width()
+        canvas_height = self.__canvas.winfo_height()
+
+        # All objects have the same shape and settings, except that each one
+        # gets its own color in chameleon mode. If there are many objects,
+        # they start from random positions.
+        scene = Scene()
+        object_count = int(self.__object_count.get())
+
+        for i in range(object_count):
+            object_settings = [
+                canvas_width,
+                canvas_height,
+                self.__object_size.get(),
+                self.color_get(),
+                self.__random_color.get(),
+                int(self.__object_thickness.get()),
+                self.__object_velocity.get(),
+                x_rotation,
+                y_rotation,
+                z_rotation
+                ]
+
+            scene_object = Object(*shape, *object_settings, faces,
+                                  self.__hide_back_lines.get(),
+                                  color_mode=self.__color_mode.get(),
+                                  depth_cue=self.__depth_cue.get(),
+                                  point_cloud=self.__point_cloud.get())
+
+            if object_count > 1:
+                scene_object.set_position(random.uniform(0, canvas_width),
+                                          random.uniform(0, canvas_height))
+
+            scene.add(scene_object)
+
+        # Removes the previous objects' lines, in retained rendering they
+        # won't be cleared after every frame.
+        self.__canvas.delete(ALL)
+
+        if self.__image_rendering.get():
+            self.__image_buffer = PhotoImageBuffer(self.__canvas)
+        else:
+            self.__image_buffer = None
+
+        # Stops animating the previous object and starts animating the new
+        # one.
+        if self.__frame_job is not None:
+            self.__root.after_cancel(self.__frame_job)
+
+        self.__scene = scene
+        self.__previous_frame_time = time.perf_counter()
+        self.__next_frame_time = self.__previous_frame_time
+        self.animate()
+
+    def animate(self):
+        """
+        Draws one frame of the object's animation and schedules the next frame
+        with Tk's after, so that the program waits in the main loop between
+        the frames instead of spinning. The object's rotation and movement
+        are advanced by the time that has passed since the previous frame, so
+        the animation speed doesn't depend on the frame rate. If drawing
+        falls behind, the missed frames are skipped. If nothing on the canvas
+        would change, no frame is drawn and no next frame is scheduled, the
+        animation is started again by wake_animation.
+        :return: None
+        """
+
+        self.__frame_job = None
+
+        if self.crashed():
+            return
+
+        if not self.__scene.needs_redraw(self.__canvas):
+            if self.__show_stats:
+                self.draw_stats()
+            return
+
+        now = time.perf_counter()
+
+        # A long pause, for example while the window is being dragged, is
+        # limited so that the object doesn't jump across the canvas.
+        elapsed = min(now - self.__previous_frame_time, MAX_FRAME_TIME)
+        self.__previous_frame_time = now
+
+        self.__profiler.start_frame()
+
+        if self.__image_buffer is not None:
+            # The objects are drawn into the image, which replaces the
+            # previous frame when it's shown.
+            self.__image_buffer.clear()
+            self.__scene.draw(self.__image_buffer,
+                              elapsed * ANIMATION_STEPS_PER_SECOND,
+                              self.__profiler)
+
+            with self.__profiler.stage("show_image"):
+                self.__image_buffer.show()
+        else:
+            if not object_visualizer.retained_rendering:
+                self.__canvas.delete(ALL)
+
+            self.__scene.draw(self.__canvas,
+                              elapsed * ANIMATION_STEPS_PER_SECOND,
+                              self.__profiler)
+
+        if self.__show_stats:
+            self.draw_stats()
+
+        # The canvas is redrawn here, so that the time it takes is included
+        # in the frame. Events are handled by the main loop after this.
+        with self.__profiler.stage("canvas.update"):
+            self.__canvas.update_idletasks()
+
+        self.__profiler.end_frame()
+
+        # The next frame is due one frame interval after the previous one. If
+        # that moment has already passed, the missed frames are skipped.
+        frame_interval = 1 / TARGET_FPS
+        self.__next_frame_time += frame_interval
+        now = time.perf_counter()
+
+        if self.__next_frame_time < now:
+            self.__next_frame_time = now
+
+        delay = max(1, int((self.__next_frame_time - now) * 1000))
+
+        # The animation may have been woken up during the frame.
+        if self.__frame_job is not None:
+            self.__root.after_cancel(self.__frame_job)
+
+        self.__frame_job = self.__root.after(delay, self.animate)
+
+
+BLACK = "#000000"
+GREY = "#4f4f4f"
+WHITE = "#ffffff"
+RED = "#ff0000"
+GREEN = "#00ff00"
+BLUE = "#0000ff"
+
+disable_intro = False  # Disables intro if set to True.
+
+# The frame rate the animation is drawn at. Rotation and velocity settings are
+# amounts per animation step and ANIMATION_STEPS_PER_SECOND steps are taken in
+# a second, no matter how many frames are actually drawn.
+TARGET_FPS = 60
+ANIMATION_STEPS_PER_SECOND = 250
+MAX_FRAME_TIME = 0.25   # Longest time in seconds advanced in one frame.
+
+# Frame statistics are shown on the canvas if set to True, they can also be
+# toggled with F3. If profile_csv_path is set, the frame timings are saved
+# into that file on exit.
+show_stats = False
+profile_csv_path = None
+
+# If set to True, the objects are drawn into an image that is shown on the
+# canvas as one PhotoImage instead of drawing every edge as a canvas line.
+# The time used by the canvas then doesn't depend on the number of edges,
+# which is faster for large meshes. Can also be changed with the "Draw as
+# image" setting.
+image_rendering = False
@@ -0,0 +1,358 @@
+"""
+Regression tests for object_visualizer.py, run with:
+
+    python -m unittest test_object_visualizer
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from math import pi
+
+import numpy as np
+
+import object_visualizer as visualizer
+
+
+class MeshLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.__directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.__directory.cleanup()
+
+    def write(self, name, data):
+        # Writes a file into the temporary directory and returns its path.
+        path = os.path.join(self.__directory.name, name)
+        mode = "wb" if isinstance(data, bytes) else "w"
+
+        with open(path, mode) as file:
+            file.write(data)
+
+        return path
+
+    def write_points_ply(self, count):
+        # Writes a binary PLY-file of random vertexes without faces.
+        points = np.random.rand(count, 3).astype("<f4")
+        header = (b"ply\nformat binary_little_endian 1.0\n"
+                  b"element vertex %d\nproperty float x\nproperty float y\n"
+                  b"property float z\nend_header\n" % count)
+
+        return self.write("points.ply", header + points.tobytes())
+
+    def assert_no_edges(self, path, vertex_count):
+        vertexes, edges = visualizer.load_mesh(path)
+
+        self.assertEqual(vertexes.shape, (vertex_count, 3))
+        self.assertEqual(edges.shape, (0, 2))
+
+    def test_obj_without_faces(self):
+        path = self.write("points.obj", "v 0 0 0\nv 1 0 0\nv 0 1 0\n")
+        self.assert_no_edges(path, 3)
+
+    def test_obj_with_degenerate_face(self):
+        path = self.write("degenerate.obj",
+                          "v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 1 1\n")
+        self.assert_no_edges(path, 3)
+
+    def test_ply_without_faces(self):
+        self.assert_no_edges(self.write_points_ply(1000), 1000)
+
+    def test_stl_without_triangles(self):
+        path = self.write("empty.stl", bytes(80) + struct.pack("<I", 0))
+        self.assert_no_edges(path, 0)
+
+    def test_point_cloud_without_edges(self):
+        # Point clouds are drawn from the vertexes, so they don't need edges.
+        vertexes, edges = visualizer.load_mesh(self.write_points_ply(1000))
+
+        object = visualizer.Object(visualizer.normalize_vertexes(vertexes),
+                                   edges, 200, 200, 50, (0, 255, 0), False, 1,
+                                   0, 0.005, 0.005, 0, point_cloud=True)
+        frame_buffer = visualizer.FrameBuffer(200, 200)
+        object.draw(frame_buffer)
+
+        self.assertTrue(frame_buffer.pixels().any())
+
+
+class ShapeTest(unittest.TestCase):
+
+    def test_dodecahedron_edges_are_the_nearest_neighbors(self):
+        vertexes, edges = visualizer.PREDEFINED_SHAPES["regular_dodecahedron"]
+
+        self.assertEqual(
+            visualizer.nearest_neighbor_edges(vertexes).tolist(),
+            [list(edge) for edge in edges])
+
+
+class NeighborSearchTest(unittest.TestCase):
+
+    def brute_force_pairs(self, vertexes, radius):
+        # Compares every pair of points with each other.
+        distances = np.sqrt(((vertexes[:, np.newaxis] - vertexes) ** 2)
+                            .sum(axis=2))
+        first, second = np.triu_indices(len(vertexes), 1)
+        close = distances[first, second] <= radius
+
+        return sorted(zip(first[close].tolist(), second[close].tolist()))
+
+    def test_grid_neighbor_pairs(self):
+        random = np.random.default_rng(1)
+
+        for count, radius in [(2, 0.5), (300, 0.1), (1000, 0.05)]:
+            vertexes = random.random((count, 3))
+            pairs, distances = visualizer.grid_neighbor_pairs(vertexes,
+                                                              radius)
+
+            self.assertEqual(sorted(map(tuple, pairs.tolist())),
+                             self.brute_force_pairs(vertexes, radius))
+            self.assertTrue((distances <= radius).all())
+
+    def test_shortest_distance(self):
+        vertexes = np.random.default_rng(2).random((500, 3))
+        distances = np.sqrt(((vertexes[:, np.newaxis] - vertexes) ** 2)
+                            .sum(axis=2))
+        shortest = distances[np.triu_indices(len(vertexes), 1)].min()
+
+        self.assertAlmostEqual(visualizer.shortest_distance(vertexes),
+                               shortest)
+
+    def test_nearest_neighbor_edges(self):
+        # A grid of points is connected to its neighbors along the axes.
+        vertexes = np.array([(x, y, z) for x in range(4) for y in range(3)
+                             for z in range(2)], dtype=float)
+        edges = visualizer.nearest_neighbor_edges(vertexes)
+
+        self.assertEqual(list(map(tuple, edges.tolist())),
+                         self.brute_force_pairs(vertexes, 1.0))
+
+
+class ParserTest(unittest.TestCase):
+
+    def assert_parse_error(self, parse, text, token):
+        # Checks that parsing fails at the position of given token.
+        with self.assertRaises(visualizer.ParseError) as context:
+            parse(text)
+
+        self.assertEqual(context.exception.position, text.index(token))
+
+    def parse_edges(self, text):
+        return visualizer.parse_edges(text, 4)
+
+    def test_edge_separators(self):
+        # Values and tuples can be separated with commas, whitespace or both.
+        for text in ["(0,1), (1,2),(2,3)", "(0 1) (1\t,2)\n( 2 , 3 )",
+                     "0,1, 1,2, 2,3", "0 1\n1 2\n2 3"]:
+            self.assertEqual(self.parse_edges(text).tolist(),
+                             [[0, 1], [1, 2], [2, 3]])
+
+    def test_point_separators(self):
+        for text in ["(1,2.5,-3), (4e1 .5 6)", "1 2.5 -3\n4e1, .5, 6"]:
+            self.assertEqual(visualizer.parse_points(text).tolist(),
+                             [[1, 2.5, -3], [40, 0.5, 6]])
+
+    def test_duplicate_edges(self):
+        self.assert_parse_error(self.parse_edges, "(0,1), (1,2), ( 0,1)",
+                                "( 0,1)")
+        self.assert_parse_error(self.parse_edges, "(0,1), (1,2), (1,0)",
+                                "(1,0)")
+
+    def test_edge_to_itself(self):
+        self.assert_parse_error(self.parse_edges, "(0,1), (2,2)", "(2,2)")
+
+    def test_edge_out_of_range(self):
+        self.assert_parse_error(self.parse_edges, "(0,1), (1,4)", "(1,4)")
+        self.assert_parse_error(self.parse_edges, "(0,1), (-1,2)", "(-1,2)")
+
+    def test_float_in_edges(self):
+        self.assert_parse_error(self.parse_edges, "(0,1), (1,2.5)", "2.5")
+        self.assert_parse_error(self.parse_edges, "0 1 1 2e1", "2e1")
+
+    def test_too_large_integers(self):
+        self.assert_parse_error(lambda text: visualizer.parse_edges(text, 3),
+                                "(0,1), (1,99999999999999999999)",
+                                "99999999999999999999")
+        self.assert_parse_error(lambda text: visualizer.parse_faces(text, 3),
+                                "(0,1,-99999999999999999999)",
+                                "-99999999999999999999")
+
+    def test_infinite_points(self):
+        self.assert_parse_error(visualizer.parse_points,
+                                "(1,2,3), (1e999,0,0)", "1e999")
+        self.assert_parse_error(visualizer.parse_points, "1 2 3\n4 5 -1e400",
+                                "-1e400")
+
+
+class ProjectionTest(unittest.TestCase):
+
+    def test_vertexes_are_projected_once_per_frame(self):
+        vertexes, edges = visualizer.PREDEFINED_SHAPES["regular_dodecahedron"]
+        object = visualizer.Object(vertexes, edges, 800, 600, 100,
+                                   (0, 255, 0), False, 1, 1, 0.005, 0.005, 0)
+        object.draw(visualizer.FrameBuffer(800, 600))
+
+        self.assertEqual(object.projection_count(), len(vertexes))
+
+    def test_scene_uses_parallel_projection(self):
+        vertexes = np.random.rand(1000, 3) * 2 - 1
+        edges = np.zeros((0, 2), dtype=np.int32)
+        object = visualizer.Object(vertexes, edges, 800, 600, 100,
+                                   (0, 255, 0), False, 1, 0, 0.005, 0.005, 0,
+                                   point_cloud=True)
+        scene = visualizer.Scene([object])
+        expected = object.project_vertexes()
+
+        settings = (visualizer.parallel_projection,
+                    visualizer.PARALLEL_PROJECTION_MIN_VERTEXES,
+                    visualizer.PROJECTION_WORKERS)
+        visualizer.parallel_projection = True
+        visualizer.PARALLEL_PROJECTION_MIN_VERTEXES = 1
+        visualizer.PROJECTION_WORKERS = 2
+
+        try:
+            projected = scene.project_vertexes()[0]
+            projector = object.parallel_projector()
+
+            self.assertIsNotNone(projector)
+            self.assertIs(projected, projector.project(
+                object.rotation_matrix(), object.size(), object.camera()))
+            self.assertTrue(np.allclose(projected, expected))
+            projector.close()
+
+        finally:
+            (visualizer.parallel_projection,
+             visualizer.PARALLEL_PROJECTION_MIN_VERTEXES,
+             visualizer.PROJECTION_WORKERS) = settings
+
+
+class MeshDataTest(unittest.TestCase):
+
+    def test_objects_share_mesh_data(self):
+        vertexes = np.random.rand(1000, 3)
+        edges = np.stack([np.arange(999), np.arange(1, 1000)], axis=1)
+        objects = [visualizer.Object(vertexes, edges, 400, 400, 50,
+                                     (0, 255, 0), False, 1, 0, 0, 0, 0)
+                   for i in range(2)]
+
+        self.assertIs(objects[0].vertexes(), objects[1].vertexes())
+        self.assertIs(objects[0].detail_level(-2), objects[1].detail_level(-2))
+
+        # A copy of the vertexes is a different mesh.
+        other = visualizer.Object(vertexes.copy(), edges, 400, 400, 50,
+                                  (0, 255, 0), False, 1, 0, 0, 0, 0)
+        self.assertIsNot(other.vertexes(), objects[0].vertexes())
+
+
+class DetailTest(unittest.TestCase):
+
+    def test_finest_level_within_edge_budget(self):
+        # A sphere of latitude and longitude lines.
+        count = 150
+        latitudes, longitudes = np.meshgrid(
+            np.linspace(0, pi, count),
+            np.linspace(0, 2 * pi, count, endpoint=False), indexing="ij")
+        vertexes = np.stack([np.sin(latitudes) * np.cos(longitudes),
+                             np.sin(latitudes) * np.sin(longitudes),
+                             np.cos(latitudes)], axis=-1).reshape(-1, 3)
+        indexes = np.arange(count * count).reshape(count, count)
+        edges = np.concatenate([
+            np.stack([indexes[:-1].ravel(), indexes[1:].ravel()], axis=1),
+            np.stack([indexes.ravel(), np.roll(indexes, -1, 1).ravel()],
+                     axis=1)])
+
+        budget = visualizer.LOD_MAX_EDGES
+        visualizer.LOD_MAX_EDGES = 5000
+
+        try:
+            # The object is so large that the error limit alone would keep
+            # all of the edges.
+            object = visualizer.Object(vertexes, edges, 800, 600, 1000,
+                                       (0, 255, 0), False, 1, 0, 0, 0, 0)
+            object.draw(visualizer.FrameBuffer(800, 600))
+            drawn = len(object.detail_mesh()[1])
+            counts = [len(object.detail_level(level)[1])
+                      for level in range(-10, 2)]
+
+            self.assertLess(drawn, len(edges))
+            self.assertEqual(drawn, max(count for count in counts
+                                        if count <= 5000))
+
+        finally:
+            visualizer.LOD_MAX_EDGES = budget
+
+
+class DrawingTest(unittest.TestCase):
+
+    def test_back_face_culling(self):
+        # A cube looked at straight on only shows its front face.
+        vertexes, edges = visualizer.PREDEFINED_SHAPES["cube"]
+        faces = visualizer.predefined_faces("cube")
+
+        for culling, drawn in [(True, 4), (False, 12)]:
+            object = visualizer.Object(vertexes, edges, 400, 400, 50,
+                                       (0, 255, 0), False, 1, 0, 0, 0, 0,
+                                       faces, culling)
+            object.draw(visualizer.FrameBuffer(400, 400))
+
+            self.assertEqual(object.drawn_edge_count(), drawn)
+
+    def test_near_plane_clipping(self):
+        # The camera is 200 pixels from the center, the last two vertexes
+        # are 190 pixels towards it and closer than the near plane.
+        camera = visualizer.Camera(distance=200, near=50)
+        vertexes = [(0, 0, 0), (1, 0, 0), (0, 0, 1.9), (1, 0, 1.9)]
+        object = visualizer.Object(vertexes, [(0, 1), (2, 3), (1, 3)], 400,
+                                   400, 100, (0, 255, 0), False, 1, 0, 0, 0,
+                                   0, camera=camera)
+        object.draw(visualizer.FrameBuffer(400, 400))
+
+        self.assertTrue(np.isnan(object.project_vertexes()[2:]).all())
+
+        # The edge behind the near plane isn't drawn and the edge that
+        # crosses it is clipped.
+        self.assertEqual(object.drawn_edge_count(), 2)
+
+    def test_depth_cue(self):
+        # The first edge is in front of the center and the second behind it.
+        vertexes = [(-1, -0.5, 1), (1, -0.5, 1), (-1, 0.5, -1), (1, 0.5, -1)]
+        object = visualizer.Object(vertexes, [(0, 1), (2, 3)], 400, 400, 100,
+                                   (0, 255, 0), False, 3, 0, 0, 0, 0,
+                                   depth_cue=True)
+        frame_buffer = visualizer.FrameBuffer(400, 400)
+        object.draw(frame_buffer)
+
+        points = object.screen_points(object.project_vertexes())
+        green = frame_buffer.pixels()[:, 200, 1]
+        near = green[int(points[0, 1]) - 3:int(points[0, 1]) + 4]
+        far = green[int(points[2, 1]) - 3:int(points[2, 1]) + 4]
+
+        # The edge further away is darker and thinner.
+        self.assertGreater(near.max(), far.max())
+        self.assertGreater(np.count_nonzero(near), np.count_nonzero(far))
+
+
+class SceneTest(unittest.TestCase):
+
+    def test_placed_objects_keep_their_positions(self):
+        vertexes, edges = visualizer.PREDEFINED_SHAPES["cube"]
+        scene = visualizer.Scene()
+
+        for x_pos, y_pos in [(100, 100), (300, 200)]:
+            object = visualizer.Object(vertexes, edges, 400, 300, 20,
+                                       (0, 255, 0), False, 1, 0, 0, 0, 0)
+            object.set_position(x_pos, y_pos)
+            scene.add(object)
+
+        # The objects keep their distance from the center of a wider canvas.
+        frame_buffer = visualizer.FrameBuffer(600, 300)
+        scene.draw(frame_buffer)
+        positions = [object.render_state(frame_buffer)[:2]
+                     for object in scene.objects()]
+
+        self.assertEqual(positions, [(200, 100), (400, 200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
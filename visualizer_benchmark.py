@@ -0,0 +1,392 @@
+"""
+Render benchmark for the 3D object visualizer
+
+Drives the pre-defined objects and synthetic meshes of different sizes
+through the projection and drawing paths of Object and reports the time used
+by each stage, frames per second and memory allocated per frame. Drawing is
+measured both headless (on a FrameBuffer) and on a Tk canvas, if a display is
+available. On the canvas the edges are drawn both as canvas lines and into
+one PhotoImage, so the two ways can be compared. The time it takes to import
+object_visualizer into a new interpreter is also measured and compared with
+IMPORT_TIME_BUDGET.
+
+The results are printed as JSON, so they can be saved and compared between
+versions:
+
+    python visualizer_benchmark.py --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import object_visualizer as visualizer
+
+# Importing object_visualizer into a new interpreter should take at most this
+# many seconds. Most of the time goes to importing numpy.
+IMPORT_TIME_BUDGET = 0.25
+
+# Run in a new interpreter to measure the import. Prints the time in seconds
+# and whether tkinter was imported.
+IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import object_visualizer
+print(time.perf_counter() - start, "tkinter" in sys.modules)
+"""
+
+
+def synthetic_mesh(vertex_count):
+    """
+    Creates a sphere made of a grid of points, where every point is connected
+    to its neighbors on the same latitude and longitude.
+    :param int vertex_count: The approximate number of vertexes.
+    :return: The vertexes as a numpy array of shape (n, 3) and the edges as a
+             numpy array of shape (m, 2).
+    """
+
+    rows = max(2, int(np.sqrt(vertex_count / 2)))
+    columns = max(3, vertex_count // rows)
+
+    latitude, longitude = np.meshgrid(np.linspace(0.1, np.pi - 0.1, rows),
+                                      np.linspace(0, 2 * np.pi, columns,
+                                                  endpoint=False),
+                                      indexing="ij")
+    vertexes = np.stack([np.sin(latitude) * np.cos(longitude),
+                         np.sin(latitude) * np.sin(longitude),
+                         np.cos(latitude)], axis=2).reshape(-1, 3)
+    vertexes = visualizer.normalize_vertexes(vertexes)
+
+    indexes = np.arange(rows * columns).reshape(rows, columns)
+    along_latitude = np.stack([indexes, np.roll(indexes, -1, axis=1)],
+                              axis=2).reshape(-1, 2)
+    along_longitude = np.stack([indexes[:-1], indexes[1:]],
+                               axis=2).reshape(-1, 2)
+
+    return vertexes, np.concatenate([along_latitude, along_longitude])
+
+
+def benchmark_shapes(sizes):
+    # Returns the shapes to be benchmarked as a dictionary of name:
+    # (vertexes, edges).
+    shapes = dict(visualizer.PREDEFINED_SHAPES)
+
+    for size in sizes:
+        shapes["mesh_%d" % size] = synthetic_mesh(size)
+
+    return shapes
+
+
+def new_object(vertexes, edges, width, height):
+    # Constructs an object with the default settings of the GUI.
+    return visualizer.Object(vertexes, edges, width, height, 100, (0, 255, 0),
+                             False, 3, 1, 0.005, 0.005, 0.002)
+
+
+def measure_import(runs):
+    """
+    Measures how long importing object_visualizer takes in a new
+    interpreter, so nothing imported by this benchmark is reused.
+    :param int runs: The number of interpreters started.
+    :return: A dictionary with the number of runs, the mean, minimum and
+             maximum import time in milliseconds, the budget in milliseconds,
+             whether the slowest import was within the budget and whether
+             tkinter was imported.
+    """
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    tkinter_imported = False
+
+    for run in range(runs):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT],
+                                cwd=directory, capture_output=True,
+                                text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        tkinter_imported = tkinter_imported or output[1] == "True"
+
+    return {"runs": runs,
+            "mean_ms": sum(times) / runs * 1000,
+            "min_ms": min(times) * 1000,
+            "max_ms": max(times) * 1000,
+            "budget_ms": IMPORT_TIME_BUDGET * 1000,
+            "within_budget": max(times) <= IMPORT_TIME_BUDGET,
+            "tkinter_imported": tkinter_imported}
+
+
+def measure(stage, frames, time_budget):
+    """
+    Calls given stage once per frame and measures it.
+    :param function stage: The stage to be measured, called without
+           parameters.
+    :param int frames: The largest number of frames measured.
+    :param float time_budget: The measuring stops after this many seconds,
+           but at least one frame is always measured.
+    :return: A dictionary with the number of measured frames, the mean,
+             minimum and maximum time of a frame in milliseconds, frames per
+             second and the mean peak memory allocated during a frame in
+             kilobytes.
+    """
+
+    stage()    # The first call may have one time costs, it isn't measured.
+
+    times = []
+    allocated = []
+    started = time.perf_counter()
+
+    while len(times) < frames and \
+            (not times or time.perf_counter() - started < time_budget):
+
+        # Memory tracing slows things down, so allocations are measured on
+        # separate calls.
+        start = time.perf_counter()
+        stage()
+        times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        stage()
+        allocated.append(tracemalloc.get_traced_memory()[1] - before)
+        tracemalloc.stop()
+
+    mean = sum(times) / len(times)
+
+    return {"frames": len(times),
+            "mean_ms": mean * 1000,
+            "min_ms": min(times) * 1000,
+            "max_ms": max(times) * 1000,
+            "fps": 1 / mean if mean > 0 else None,
+            "allocated_kb_per_frame": sum(allocated) / len(allocated) / 1000}
+
+
+def open_canvas(width, height):
+    # Opens a Tk window with a canvas for benchmarking, or returns None if
+    # there is no display. Tk is only imported when a canvas is used.
+    import tkinter
+
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        return None, None
+
+    canvas = tkinter.Canvas(root, width=width, height=height, bg="#000000")
+    canvas.pack()
+    root.update()
+
+    return root, canvas
+
+
+def benchmark_shape(vertexes, edges, frames, time_budget, width, height,
+                    canvas, workers=()):
+    """
+    Measures all stages for one shape. Parallel projection is measured once
+    for every number of worker processes in workers.
+    :return: A dictionary of stage name: result of measure.
+    """
+
+    results = {}
+    object = new_object(vertexes, edges, width, height)
+
+    def per_vertex_projection():
+        for vertex in object.vertexes():
+            object.proj(vertex)
+
+    results["proj"] = measure(per_vertex_projection, frames, time_budget)
+    results["project_vertexes"] = measure(object.project_vertexes, frames,
+                                          time_budget)
+
+    for worker_count in workers:
+        projector = visualizer.ParallelProjector(object.vertexes(),
+                                                 worker_count)
+
+        def parallel_projection():
+            projector.project(object.rotation_matrix(), object.size(),
+                              object.camera())
+
+        results["project_vertexes_parallel_%d" % worker_count] = measure(
+            parallel_projection, frames, time_budget)
+        projector.close()
+
+    results["max_cordinates"] = measure(object.max_cordinates, frames,
+                                        time_budget)
+
+    frame_buffer = visualizer.FrameBuffer(width, height)
+
+    def headless_frame():
+        frame_buffer.clear()
+        object.draw(frame_buffer)
+
+    results["draw_headless"] = measure(headless_frame, frames, time_budget)
+
+    def ppm_encoding():
+        visualizer.ppm_bytes(frame_buffer.pixels())
+
+    results["ppm_bytes"] = measure(ppm_encoding, frames, time_budget)
+
+    if canvas is not None:
+        canvas_object = new_object(vertexes, edges, width, height)
+
+        def canvas_frame():
+            if not visualizer.retained_rendering:
+                canvas.delete("all")
+            canvas_object.draw(canvas)
+            canvas.update()
+
+        results["draw_canvas"] = measure(canvas_frame, frames, time_budget)
+        canvas.delete("all")
+
+        # Tk has already been imported by open_canvas.
+        import object_visualizer_gui
+
+        image_object = new_object(vertexes, edges, width, height)
+        image_buffer = object_visualizer_gui.PhotoImageBuffer(canvas)
+
+        def image_frame():
+            image_buffer.clear()
+            image_object.draw(image_buffer)
+            image_buffer.show()
+            canvas.update()
+
+        results["draw_photo_image"] = measure(image_frame, frames,
+                                              time_budget)
+        canvas.delete("all")
+
+    return results
+
+
+def benchmark_camera(vertexes, edges, sizes, frames, time_budget, width,
+                     height, canvas):
+    """
+    Measures how much of the drawing frustum culling avoids when the object
+    is so large that only a part of it is visible. The object is drawn with
+    each size with and without frustum culling, edges behind the camera are
+    clipped in both cases.
+    :param list sizes: The sizes the object is drawn with.
+    :return: A dictionary of size: results, where the results contain the
+             number of edges, the number of edges drawn with culling and the
+             result of measure for each way of drawing.
+    """
+
+    results = {}
+
+    for size in sizes:
+        object = visualizer.Object(vertexes, edges, width, height, size,
+                                   (0, 255, 0), False, 1, 0, 0.005, 0.005,
+                                   0.002)
+        frame_buffer = visualizer.FrameBuffer(width, height)
+
+        def headless_frame():
+            frame_buffer.clear()
+            object.draw(frame_buffer)
+
+        size_results = {}
+
+        for culling in (True, False):
+            visualizer.frustum_culling = culling
+            name = "culled" if culling else "not_culled"
+
+            size_results["draw_headless_" + name] = measure(
+                headless_frame, frames, time_budget)
+            size_results["drawn_edges_" + name] = object.drawn_edge_count()
+
+            if canvas is not None:
+                def canvas_frame():
+                    object.draw(canvas)
+                    canvas.update()
+
+                size_results["draw_canvas_" + name] = measure(
+                    canvas_frame, frames, time_budget)
+                canvas.delete("all")
+
+        visualizer.frustum_culling = True
+
+        # The edges of the level of detail the object was drawn with.
+        size_results["edges"] = len(object.detail_mesh()[1])
+        results[str(size)] = size_results
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="3D object visualizer "
+                                                 "render benchmark")
+    parser.add_argument("--frames", type=int, default=100,
+                        help="largest number of frames measured per stage")
+    parser.add_argument("--time-budget", type=float, default=2.0,
+                        help="seconds after which a stage stops measuring")
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=[1000, 10000, 100000],
+                        help="vertex counts of the synthetic meshes")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--no-canvas", action="store_true",
+                        help="don't measure drawing on a Tk canvas")
+    parser.add_argument("--camera-mesh", type=int, default=100000,
+                        help="vertex count of the mesh used for measuring "
+                             "frustum culling, 0 to skip it")
+    parser.add_argument("--camera-sizes", type=float, nargs="*",
+                        default=[100, 400, 1600],
+                        help="object sizes frustum culling is measured with")
+    parser.add_argument("--workers", type=int, nargs="*", default=[],
+                        help="worker process counts parallel projection is "
+                             "measured with")
+    parser.add_argument("--import-runs", type=int, default=5,
+                        help="number of interpreters the import time is "
+                             "measured with, 0 to skip it")
+    parser.add_argument("--output", default=None,
+                        help="file the JSON results are written into")
+    args = parser.parse_args()
+
+    root, canvas = None, None
+    if not args.no_canvas:
+        root, canvas = open_canvas(args.width, args.height)
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "canvas": canvas is not None,
+        "cpus": os.cpu_count(),
+        "shapes": {}
+    }
+
+    if args.import_runs > 0:
+        report["import"] = measure_import(args.import_runs)
+
+    for name, (vertexes, edges) in benchmark_shapes(args.sizes).items():
+        results = benchmark_shape(vertexes, edges, args.frames,
+                                  args.time_budget, args.width, args.height,
+                                  canvas, args.workers)
+        results["vertexes"] = len(vertexes)
+        results["edges"] = len(edges)
+        report["shapes"][name] = results
+
+    if args.camera_mesh > 0:
+        vertexes, edges = synthetic_mesh(args.camera_mesh)
+        report["camera"] = benchmark_camera(vertexes, edges,
+                                            args.camera_sizes, args.frames,
+                                            args.time_budget, args.width,
+                                            args.height, canvas)
+
+    if root is not None:
+        root.destroy()
+
+    text = json.dumps(report, indent=2)
+
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()